@@ -2,14 +2,152 @@
 
 import os
 import base64
-import time
+import shutil
+import hashlib
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Concurrent Stability.AI requests. There is no fixed delay between calls:
+# backoff only happens when the API actually answers 429/503 (honoring
+# Retry-After). Lower this if rate-limit retries show up regularly.
+MAX_CONCURRENT_REQUESTS = 4
+
+# Rendered images are kept here, keyed by prompt and generation settings, so
+# re-running the same prompts skips the API. Least recently used files are
+# evicted beyond IMAGE_CACHE_MAX_ENTRIES.
+IMAGE_CACHE_DIR = Path.home() / ".cache" / "shortsyt" / "images"
+IMAGE_CACHE_MAX_ENTRIES = 500
+
+# Generation settings sent with every request (part of the cache key)
+CFG_SCALE = 7
+STEPS = 30
+
+# Shared HTTP session so every Stability.AI call reuses pooled keep-alive
+# connections. The pool blocks rather than opening extra throwaway
+# connections, so at most MAX_CONCURRENT_REQUESTS TLS handshakes happen per
+# process. Rate limits (429) and transient 5xx errors are retried by the
+# adapter with exponential backoff.
+_retry = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["POST"]),
+    raise_on_status=False,
+    respect_retry_after_header=True,
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_CONCURRENT_REQUESTS,
+    pool_block=True,
+    max_retries=_retry,
+))
+
+
+def _link_or_copy(src: str, dst: Path):
+    """Hardlink src to dst, falling back to a copy (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _cache_path(engine_id: str, prompt: str, width: int, height: int) -> Path:
+    """Location of the cached render for this prompt and these settings."""
+    key = hashlib.sha1(
+        f"{engine_id}|{prompt}|{width}x{height}|{CFG_SCALE}|{STEPS}".encode()
+    ).hexdigest()
+    return IMAGE_CACHE_DIR / f"{key}.png"
+
+
+def _evict_image_cache():
+    """Drop least recently used cache entries beyond IMAGE_CACHE_MAX_ENTRIES."""
+    entries = sorted(
+        IMAGE_CACHE_DIR.glob("*.png"),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for stale in entries[IMAGE_CACHE_MAX_ENTRIES:]:
+        stale.unlink(missing_ok=True)
+
+
+def _render_one(
+    i: int,
+    prompt: str,
+    url: str,
+    headers: dict,
+    output_path: Path,
+    width: int,
+    height: int,
+) -> tuple[int, Optional[str]]:
+    """
+    Generate a single image and save it as NN.png.
+
+    Returns:
+        Tuple of (index, saved path or None on failure)
+    """
+    # Save with zero-padded numbering (01.png, 02.png, etc.); the body goes
+    # to a temp file first so a failed download never leaves a truncated PNG
+    file_path = output_path / f"{i:02d}.png"
+    tmp_path = file_path.with_suffix(".tmp")
+
+    try:
+        # 429/5xx are retried with backoff by the session
+        response = _SESSION.post(
+            url,
+            headers=headers,
+            json={
+                "text_prompts": [
+                    {
+                        "text": prompt
+                    }
+                ],
+                "cfg_scale": CFG_SCALE,
+                "height": height,
+                "width": width,
+                "samples": 1,
+                "steps": STEPS
+            },
+            stream=True,
+        )
+
+        with response:
+            # Handle API errors
+            if response.status_code != 200:
+                print(f"    Image {i} error: API Error {response.status_code}: {response.text}")
+                return i, None
+
+            if response.headers.get("Content-Type", "").startswith("application/json"):
+                # Fallback: base64 artifacts in a JSON body
+                data = response.json()
+                for artifact in data["artifacts"]:
+                    with open(tmp_path, "wb") as f:
+                        f.write(base64.b64decode(artifact["base64"]))
+            else:
+                # Stream the PNG body straight to disk
+                response.raw.decode_content = True
+                with open(tmp_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=65536)
+
+        os.replace(tmp_path, file_path)
+        return i, str(file_path)
+
+    except requests.exceptions.RequestException as e:
+        print(f"    Image {i} network error: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return i, None
+    except Exception as e:
+        print(f"    Image {i} error: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return i, None
+
 
 def generate_images_for_short(
     visual_suggestions: list[str],
@@ -18,10 +156,14 @@ def generate_images_for_short(
     width: int = 768,
     height: int = 1344,
     engine_id: str = "stable-diffusion-xl-1024-v1-0",
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
 ) -> List[str]:
     """
     Generate vertical images for YouTube Shorts using Stability.AI.
 
+    Requests are dispatched concurrently; results keep the 01.png..NN.png
+    ordering of the visual suggestions.
+
     Args:
         visual_suggestions: List of image prompts from script generation
         output_dir: Directory to save generated images
@@ -29,6 +171,8 @@ def generate_images_for_short(
         width: Image width (default: 768 for 9:16 ratio)
         height: Image height (default: 1344 for 9:16 ratio)
         engine_id: Stability.AI engine to use
+        max_workers: Requests in flight at once (the shared connection pool
+            caps this at MAX_CONCURRENT_REQUESTS)
 
     Returns:
         List of paths to generated images
@@ -53,106 +197,87 @@ def generate_images_for_short(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    print(f"\nGenerating {len(visual_suggestions)} images using Stability.AI...")
+    total = len(visual_suggestions)
+    print(f"\nGenerating {total} images using Stability.AI...")
     print(f"  Resolution: {width}x{height} (9:16 vertical)")
     print(f"  Output: {output_dir}/")
     print()
 
     api_host = "https://api.stability.ai"
-    generated_images = []
-
-    # Generate image for each visual suggestion
-    for i, prompt in enumerate(visual_suggestions, 1):
-        if not prompt:
-            print(f"  Image {i}/{len(visual_suggestions)}: Skipping empty prompt")
-            continue
-
-        # Truncate prompt for display
-        prompt_preview = prompt[:60] + ("..." if len(prompt) > 60 else "")
-        print(f"  Image {i}/{len(visual_suggestions)}: \"{prompt_preview}\"")
-
-        # Make API request
-        try:
-            response = requests.post(
-                f"{api_host}/v1/generation/{engine_id}/text-to-image",
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                    "Authorization": f"Bearer {api_key}"
-                },
-                json={
-                    "text_prompts": [
-                        {
-                            "text": prompt
-                        }
-                    ],
-                    "cfg_scale": 7,
-                    "height": height,
-                    "width": width,
-                    "samples": 1,
-                    "steps": 30
-                },
-            )
+    url = f"{api_host}/v1/generation/{engine_id}/text-to-image"
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "image/png",
+        "Authorization": f"Bearer {api_key}"
+    }
+    results = []
+    first_index = {}  # prompt -> index of the image that renders it
+    duplicates = []  # (index, index of the identical prompt)
 
-            # Handle API errors
-            if response.status_code != 200:
-                error_msg = f"API Error {response.status_code}: {response.text}"
-                print(f"    Error: {error_msg}")
-
-                # Check for rate limit
-                if response.status_code == 429:
-                    print("    Rate limit hit, waiting 60 seconds...")
-                    time.sleep(60)
-                    # Retry once
-                    response = requests.post(
-                        f"{api_host}/v1/generation/{engine_id}/text-to-image",
-                        headers={
-                            "Content-Type": "application/json",
-                            "Accept": "application/json",
-                            "Authorization": f"Bearer {api_key}"
-                        },
-                        json={
-                            "text_prompts": [{"text": prompt}],
-                            "cfg_scale": 7,
-                            "height": height,
-                            "width": width,
-                            "samples": 1,
-                            "steps": 30
-                        },
-                    )
-
-                    if response.status_code != 200:
-                        print(f"    Retry failed: {response.status_code}")
-                        continue
-                else:
-                    continue
-
-            # Parse response and save image
-            data = response.json()
-
-            for artifact in data["artifacts"]:
-                img_bytes = base64.b64decode(artifact["base64"])
-
-                # Save with zero-padded numbering (01.png, 02.png, etc.)
+    # No point starting more threads than there are prompts or pooled connections
+    workers = max(1, min(max_workers, MAX_CONCURRENT_REQUESTS, total))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for i, prompt in enumerate(visual_suggestions, 1):
+            if not prompt:
+                print(f"  Image {i}/{total}: Skipping empty prompt")
+                continue
+
+            # Identical prompts are rendered once and copied afterwards
+            if prompt in first_index:
+                print(f"  Image {i}/{total}: Same prompt as image {first_index[prompt]}, reusing")
+                duplicates.append((i, first_index[prompt]))
+                continue
+            first_index[prompt] = i
+
+            # Truncate prompt for display
+            prompt_preview = prompt[:60] + ("..." if len(prompt) > 60 else "")
+
+            # Rendered by an earlier run with the same settings
+            cached = _cache_path(engine_id, prompt, width, height)
+            if cached.exists():
+                print(f"  Image {i}/{total}: \"{prompt_preview}\" (cached)")
                 file_path = output_path / f"{i:02d}.png"
+                shutil.copyfile(cached, file_path)
+                os.utime(cached)  # Mark as recently used
+                results.append((i, str(file_path)))
+                continue
+
+            print(f"  Image {i}/{total}: \"{prompt_preview}\"")
 
-                with open(file_path, "wb") as f:
-                    f.write(img_bytes)
+            future = pool.submit(_render_one, i, prompt, url, headers, output_path, width, height)
+            futures[future] = (i, cached)
 
-                generated_images.append(str(file_path))
+        # Report progress as images finish
+        for future in as_completed(futures):
+            i, file_path = future.result()
+            if file_path:
+                results.append((i, file_path))
                 print(f"    Saved: {file_path}")
 
-        except requests.exceptions.RequestException as e:
-            print(f"    Network error: {e}")
-            continue
-        except Exception as e:
-            print(f"    Error: {e}")
-            continue
+                # Store via a temp file so an interrupted copy never looks like a hit
+                cached = futures[future][1]
+                IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp = cached.with_suffix(".tmp")
+                shutil.copyfile(file_path, tmp)
+                os.replace(tmp, cached)
+
+    if futures:
+        _evict_image_cache()
+
+    rendered = dict(results)
+    for i, source_index in duplicates:
+        source = rendered.get(source_index)
+        if source:
+            file_path = output_path / f"{i:02d}.png"
+            _link_or_copy(source, file_path)
+            results.append((i, str(file_path)))
 
-        # Small delay to avoid overwhelming the API
-        time.sleep(0.5)
+    # Restore 01.png..NN.png ordering
+    generated_images = [file_path for _, file_path in sorted(results)]
 
-    print(f"\nGenerated {len(generated_images)}/{len(visual_suggestions)} images successfully")
+    print(f"\nGenerated {len(generated_images)}/{total} images successfully")
 
     if len(generated_images) == 0:
         raise Exception("Failed to generate any images. Check API key and network connection.")
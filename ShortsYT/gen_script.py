@@ -1,9 +1,11 @@
 """Generate short script for YouTube Shorts from just a title."""
 
 import os
+import json
+import hashlib
+import functools
+from pathlib import Path
 from pydantic import BaseModel
-from agents import Agent, Runner, ModelSettings
-from agents.extensions.models.litellm_model import LitellmModel
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -26,11 +28,7 @@ class ShortsScriptWithVisuals(BaseModel):
     visual_suggestions: list[str]  # List of image prompts for AI generation
 
 
-agent = Agent(
-    name="ShortsScriptWriter",
-    model=LitellmModel(model="anthropic/claude-sonnet-4-5", api_key=claude_api_key),
-    model_settings=ModelSettings(include_usage=True),
-    instructions="""You are an expert YouTube Shorts script writer specializing in viral, attention-grabbing content.
+SCRIPT_INSTRUCTIONS = """You are an expert YouTube Shorts script writer specializing in viral, attention-grabbing content.
 
 OUTPUT FORMAT (all fields required):
 {
@@ -71,16 +69,10 @@ STRUCTURE:
 - Body (1.5-25 sec): Deliver the main content quickly
 - Ending (25-30 sec): Punchline, CTA, or cliffhanger
 
-Keep it SHORT and PUNCHY. Every word must earn its place.""",
-    output_type=ShortsScript,
-)
+Keep it SHORT and PUNCHY. Every word must earn its place."""
 
 
-agent_with_visuals = Agent(
-    name="ShortsScriptWriterWithVisuals",
-    model=LitellmModel(model="anthropic/claude-sonnet-4-5", api_key=claude_api_key),
-    model_settings=ModelSettings(include_usage=True),
-    instructions="""You are an expert YouTube Shorts script writer specializing in viral, attention-grabbing content WITH visual suggestions for AI image generation.
+VISUALS_SCRIPT_INSTRUCTIONS = """You are an expert YouTube Shorts script writer specializing in viral, attention-grabbing content WITH visual suggestions for AI image generation.
 
 OUTPUT FORMAT (all fields required):
 {
@@ -141,9 +133,72 @@ VISUAL SUGGESTION EXAMPLES:
 - "Anime style dramatic portrait of a character looking shocked with speed lines"
 - "Anime style mystical energy orb floating in darkness with colorful aura"
 
-Keep it SHORT and PUNCHY. Every word must earn its place.""",
-    output_type=ShortsScriptWithVisuals,
-)
+Keep it SHORT and PUNCHY. Every word must earn its place."""
+
+
+@functools.lru_cache(maxsize=None)
+def get_agent(include_visuals: bool = False):
+    """Build the script-writing agent once per variant and reuse it across calls.
+
+    agents/litellm are imported here so importing this module (e.g. for
+    --help or a cached title) doesn't pay their startup cost.
+    """
+    from agents import Agent, ModelSettings
+    from agents.extensions.models.litellm_model import LitellmModel
+
+    if include_visuals:
+        name, instructions, output_type = (
+            "ShortsScriptWriterWithVisuals", VISUALS_SCRIPT_INSTRUCTIONS, ShortsScriptWithVisuals
+        )
+    else:
+        name, instructions, output_type = "ShortsScriptWriter", SCRIPT_INSTRUCTIONS, ShortsScript
+
+    return Agent(
+        name=name,
+        model=LitellmModel(model="anthropic/claude-sonnet-4-5", api_key=claude_api_key),
+        model_settings=ModelSettings(include_usage=True),
+        instructions=instructions,
+        output_type=output_type,
+    )
+
+
+# Changes whenever either system prompt is edited, so cached scripts from an
+# older prompt are never served
+PROMPT_HASH = hashlib.sha1(
+    (SCRIPT_INSTRUCTIONS + VISUALS_SCRIPT_INSTRUCTIONS).encode()
+).hexdigest()[:12]
+
+
+# Generated scripts persist here so re-running a title skips the API call
+SCRIPT_CACHE_DIR = Path(__file__).parent / ".cache" / "scripts"
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_script(prompt_hash: str, title: str, include_visuals: bool) -> str:
+    """Return the script as a JSON string, from disk if this title was generated before."""
+    key = hashlib.sha1(f"{prompt_hash}|{title}|{include_visuals}".encode()).hexdigest()
+    cache_path = SCRIPT_CACHE_DIR / f"{key}.json"
+    if cache_path.exists():
+        print("  (using cached script)")
+        return cache_path.read_text(encoding="utf-8")
+
+    prompt = f"""Create a viral YouTube Shorts script for this topic:
+
+**Title:** {title}
+
+Generate a ~30 second script that hooks viewers in the first 1.5 seconds with an OUTCOME (not backstory) and keeps them watching until the end."""
+
+    from agents import Runner
+
+    result = Runner.run_sync(get_agent(include_visuals), prompt)
+    script_json = json.dumps(result.final_output.model_dump())
+
+    SCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_text(script_json, encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+    return script_json
 
 
 def generate_script(title: str, include_visuals: bool = False) -> dict:
@@ -161,15 +216,8 @@ def generate_script(title: str, include_visuals: bool = False) -> dict:
     if include_visuals:
         print("  (with visual suggestions for AI images)")
 
-    prompt = f"""Create a viral YouTube Shorts script for this topic:
-
-**Title:** {title}
-
-Generate a ~30 second script that hooks viewers in the first 1.5 seconds with an OUTCOME (not backstory) and keeps them watching until the end."""
-
-    selected_agent = agent_with_visuals if include_visuals else agent
-    result = Runner.run_sync(selected_agent, prompt)
-    return result.final_output.model_dump()
+    # Decode a fresh dict on every call so callers can't mutate the cached copy
+    return json.loads(_cached_script(PROMPT_HASH, title, include_visuals))
 
 
 if __name__ == "__main__":
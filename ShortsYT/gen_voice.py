@@ -1,6 +1,8 @@
 """Generate voiceover for YouTube Shorts using ElevenLabs."""
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from elevenlabs.client import ElevenLabs
 from elevenlabs import VoiceSettings
 from dotenv import load_dotenv
@@ -14,6 +16,40 @@ client = ElevenLabs(api_key=api_key)
 DEFAULT_VOICE_ID = "V6zMK42bu1TVQBA7MwcF"
 DEFAULT_MODEL = "eleven_multilingual_v2"
 
+# Sentences are synthesized in parallel, at most this many at once
+# (ElevenLabs limits concurrent requests per plan)
+MAX_TTS_WORKERS = 4
+
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def split_sentences(narration: str) -> list[str]:
+    """Split narration on sentence boundaries, dropping empty pieces."""
+    return [s for s in _SENTENCE_RE.split(narration.strip()) if s]
+
+
+def _synthesize(text: str, previous_text: str = None, next_text: str = None) -> bytes:
+    """Convert one piece of text to MP3 bytes.
+
+    previous_text/next_text give the model the surrounding sentences so
+    intonation stays continuous across separately generated segments.
+    """
+    audio = client.text_to_speech.convert(
+        text=text,
+        voice_id=DEFAULT_VOICE_ID,
+        model_id=DEFAULT_MODEL,
+        output_format="mp3_44100_128",
+        previous_text=previous_text,
+        next_text=next_text,
+        voice_settings=VoiceSettings(
+            stability=0.5,
+            similarity_boost=0.75,
+            speed=1.2,  # 20% faster
+        ),
+    )
+    # Read the whole body before the segment is written out
+    return b"".join(audio)
+
 
 def generate_voiceover(narration: str, output_path: str) -> str:
     """
@@ -31,22 +67,31 @@ def generate_voiceover(narration: str, output_path: str) -> str:
 
     print(f"  Generating voiceover ({len(narration.split())} words)...")
 
-    audio = client.text_to_speech.convert(
-        text=narration,
-        voice_id=DEFAULT_VOICE_ID,
-        model_id=DEFAULT_MODEL,
-        output_format="mp3_44100_128",
-        voice_settings=VoiceSettings(
-            stability=0.5,
-            similarity_boost=0.75,
-            speed=1.2,  # 20% faster
-        ),
-    )
+    sentences = split_sentences(narration)
+    if not sentences:
+        raise ValueError("Narration is empty, nothing to synthesize")
+
+    # One request per sentence, run concurrently; map() keeps narration order
+    with ThreadPoolExecutor(max_workers=min(MAX_TTS_WORKERS, len(sentences))) as pool:
+        segments = pool.map(
+            _synthesize,
+            sentences,
+            [None] + sentences[:-1],
+            sentences[1:] + [None],
+        )
 
-    # Convert generator to bytes and save
-    audio_bytes = b"".join(audio)
-    with open(output_path, "wb") as f:
-        f.write(audio_bytes)
+        # Segments share one MP3 format, so their frames concatenate directly.
+        # Written to a temp file so a failed request never leaves a
+        # truncated MP3 at output_path
+        tmp_path = f"{output_path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                for segment in segments:
+                    f.write(segment)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, output_path)
 
     print(f"  Voiceover saved to: {output_path}")
     return output_path
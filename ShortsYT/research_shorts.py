@@ -1,10 +1,13 @@
 """Research YouTube channel for Shorts."""
 
 import os
-from datetime import datetime, timezone
+import functools
+from datetime import date, datetime, timezone
 import re
 import googleapiclient.discovery
+import numpy as np
 import pandas as pd
+from httplib2 import Http
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -14,14 +17,30 @@ api_service_name = "youtube"
 api_version = "v3"
 api_key = os.environ.get("YOUTUBE_API_KEY")
 
+# One persistent Http so all API calls reuse the connection to googleapis.com.
+# Http instances are not thread-safe; use one per thread if calls are parallelized.
+# The discovery document is read from the copy bundled with the client library
+# (static_discovery), so startup makes no discovery HTTP request.
+_http = Http(cache=None)
+
 youtube = googleapiclient.discovery.build(
-    api_service_name, api_version, developerKey=api_key
+    api_service_name,
+    api_version,
+    developerKey=api_key,
+    http=_http,
+    cache_discovery=False,
+    static_discovery=True,
 )
 
+COLUMNS = ["Title", "View Count", "Duration", "Days Old", "Virality Score", "Video Link"]
+
+# ISO-8601 duration as returned by the API (e.g. PT1M30S)
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
 
 def convert_to_seconds(time_str):
     """Convert YouTube duration format (PT1M30S) to seconds."""
-    match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', time_str)
+    match = _DURATION_RE.match(time_str)
     if match:
         hrs = int(match.group(1) or 0)
         minutes = int(match.group(2) or 0)
@@ -32,52 +51,44 @@ def convert_to_seconds(time_str):
         return 0
 
 
-def get_video_details(video_id, df):
-    """Get video details and add to DataFrame if it's a Short."""
-    request = youtube.videos().list(
-        part="snippet,contentDetails,statistics",
-        id=video_id
-    )
-    response = request.execute()
-
-    if not response.get("items"):
-        return df
+def _parse_video_item(item, rows, today_ord):
+    """Parse a videos.list item and append a row if it's a Short.
 
-    item = response["items"][0]
+    today_ord is today's UTC date as a proleptic ordinal (date.toordinal()).
+    """
+    video_id = item["id"]
     title = item["snippet"]["localized"]["title"]
     views = int(item["statistics"].get("viewCount", 0))
     time = item["contentDetails"]["duration"]
     published_at = item["snippet"]["publishedAt"]
 
+    # Anything with an hour component can't be a Short
+    if "H" in time:
+        return rows
+
     # Filter FOR shorts (duration <= 60 seconds)
     sec = convert_to_seconds(time)
 
     if sec <= 60 and sec > 0:  # Only include shorts
-        # Calculate days since upload
-        publish_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
-        days_old = (now - publish_date).days
-        if days_old < 1:
-            days_old = 1
-
-        # Calculate virality score: views / (days ^ 0.8)
-        virality_score = round(views / (days_old ** 0.8), 2)
+        # Days since upload, from the YYYY-MM-DD prefix of publishedAt
+        y, m, d = int(published_at[0:4]), int(published_at[5:7]), int(published_at[8:10])
+        days_old = max(1, today_ord - date(y, m, d).toordinal())
 
         # Construct video link
         video_link = f"https://youtube.com/shorts/{video_id}"
 
-        df = pd.concat([df, pd.DataFrame({
-            "Title": [title],
-            "View Count": [views],
-            "Duration": [sec],
-            "Days Old": [days_old],
-            "Virality Score": [virality_score],
-            "Video Link": [video_link]
-        })], ignore_index=True)
+        rows.append({
+            "Title": title,
+            "View Count": views,
+            "Duration": sec,
+            "Days Old": days_old,
+            "Video Link": video_link,
+        })
 
-    return df
+    return rows
 
 
+@functools.lru_cache(maxsize=256)
 def get_channel_id(channel_name):
     """Get channel ID from channel name."""
     request = youtube.search().list(
@@ -94,6 +105,7 @@ def get_channel_id(channel_name):
     return response["items"][0]["id"]["channelId"]
 
 
+@functools.lru_cache(maxsize=256)
 def get_playlist_id(channel_id):
     """Get uploads playlist ID from channel ID."""
     request = youtube.channels().list(
@@ -105,21 +117,47 @@ def get_playlist_id(channel_id):
     return response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
 
 
-def get_videos_from_playlist(playlist_id, df, max_results=50):
-    """Get videos from playlist and filter for shorts."""
+def clear_cache():
+    """Forget memoized channel and playlist lookups."""
+    get_channel_id.cache_clear()
+    get_playlist_id.cache_clear()
+
+
+def get_videos_from_playlist(playlist_id, max_results=50):
+    """Get up to max_results videos from playlist and return rows for the shorts."""
+    rows = []
+    fetched = 0
+    today_ord = datetime.now(timezone.utc).date().toordinal()
+
     request = youtube.playlistItems().list(
         part="contentDetails",
-        maxResults=max_results,
-        playlistId=playlist_id
+        maxResults=min(50, max_results),
+        playlistId=playlist_id,
+        fields="items/contentDetails/videoId,nextPageToken",
     )
-    response = request.execute()
 
-    videos_list = response.get("items", [])
+    while request is not None and fetched < max_results:
+        response = request.execute()
 
-    for v in videos_list:
-        df = get_video_details(v["contentDetails"]["videoId"], df)
+        video_ids = [v["contentDetails"]["videoId"] for v in response.get("items", [])]
+        video_ids = video_ids[:max_results - fetched]
+        if not video_ids:
+            break
+        fetched += len(video_ids)
 
-    return df
+        # One videos.list call covers up to 50 IDs
+        details = youtube.videos().list(
+            part="snippet,contentDetails,statistics",
+            id=",".join(video_ids),
+            fields="items(id,snippet(publishedAt,localized/title),contentDetails/duration,statistics/viewCount)",
+        ).execute()
+
+        for item in details.get("items", []):
+            _parse_video_item(item, rows, today_ord)
+
+        request = youtube.playlistItems().list_next(request, response)
+
+    return rows
 
 
 def research_channel(channel_name):
@@ -130,29 +168,33 @@ def research_channel(channel_name):
         channel_name: Name of the YouTube channel
 
     Returns:
-        DataFrame with shorts sorted by virality score
+        DataFrame with shorts and their virality scores (unsorted)
     """
     print(f"  Researching channel: {channel_name}")
 
-    df = pd.DataFrame(columns=["Title", "View Count", "Duration", "Days Old", "Virality Score", "Video Link"])
-
     channel_id = get_channel_id(channel_name)
     print(f"  Found channel ID: {channel_id}")
 
     playlist_id = get_playlist_id(channel_id)
-    df = get_videos_from_playlist(playlist_id, df)
+    rows = get_videos_from_playlist(playlist_id)
+
+    # Build the DataFrame once instead of growing it row by row
+    df = pd.DataFrame(rows, columns=COLUMNS)
 
     if df.empty:
         print("  No shorts found for this channel")
         return df
 
+    # Virality score: views / (days ^ 0.8), computed over the whole column
+    scores = df["View Count"].to_numpy(dtype=np.float64) / np.power(
+        df["Days Old"].to_numpy(dtype=np.float64), 0.8
+    )
+
     # Normalize virality score to 0-100 scale
-    max_score = df["Virality Score"].max()
+    max_score = scores.max()
     if max_score > 0:
-        df["Virality Score"] = round((df["Virality Score"] / max_score) * 100, 2)
-
-    # Sort by virality score
-    df = df.sort_values(by='Virality Score', ascending=False)
+        scores = scores * (100.0 / max_score)
+    df["Virality Score"] = np.round(scores, 2)
 
     print(f"  Found {len(df)} shorts")
 
@@ -165,15 +207,21 @@ def display_shorts(df, max_display=10):
     print("  TOP SHORTS")
     print("=" * 70)
 
-    df_display = df.head(max_display)
+    # Top shorts by virality score (partial selection, no full sort)
+    df_display = df.nlargest(max_display, "Virality Score").reset_index(drop=True)
 
     print(f"\n{'#':<3} {'Title':<40} {'Views':<12} {'Virality':<10}")
     print("-" * 70)
 
-    for i, (_, row) in enumerate(df_display.iterrows(), 1):
-        title = row['Title'][:37] + "..." if len(row['Title']) > 40 else row['Title']
-        views = f"{row['View Count']:,}"
-        virality = f"{row['Virality Score']:.0f}"
+    # itertuples needs identifier-safe column names for attribute access
+    rows = df_display[["Title", "View Count", "Virality Score"]].rename(
+        columns={"View Count": "ViewCount", "Virality Score": "ViralityScore"}
+    )
+
+    for i, row in enumerate(rows.itertuples(index=False), 1):
+        title = row.Title[:37] + "..." if len(row.Title) > 40 else row.Title
+        views = f"{row.ViewCount:,}"
+        virality = f"{row.ViralityScore:.0f}"
         print(f"{i:<3} {title:<40} {views:<12} {virality:<10}")
 
     print("-" * 70)
@@ -7,32 +7,71 @@ Generate a ~30 second vertical video from just a title.
 Usage:
     python run_pipeline.py                              # Interactive mode
     python run_pipeline.py --title "Your Short Title"   # Direct title mode
+    python run_pipeline.py --quiet                      # Stage banners and errors only
 """
 
 import os
 import re
+import asyncio
+import logging
 import argparse
 from datetime import datetime
 
 from gen_script import generate_script
 from gen_voice import generate_voiceover
-from gen_images import generate_images_for_short
-from video_assembler import assemble_video, get_available_videos, ASSETS_DIR
+from video_assembler import assemble_video, get_available_videos, get_video_metadata, ASSETS_DIR
 from research_shorts import research_channel, display_shorts, select_short
 
 
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_JOIN = re.compile(r'[-\s]+')
+
+
 def slugify(text: str) -> str:
     """Convert text to a filename-safe slug."""
-    text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '_', text)
-    return text[:30]
+    return _SLUG_JOIN.sub('_', _SLUG_STRIP.sub('', text.lower()))[:30]
+
+
+async def generate_media(
+    narration: str,
+    voiceover_path: str,
+    visual_suggestions: list[str] = None,
+    images_dir: str = None,
+) -> list[str]:
+    """
+    Generate the voiceover and, if requested, AI images concurrently.
 
+    Args:
+        narration: Script narration for the voiceover
+        voiceover_path: Path to save the voiceover
+        visual_suggestions: Image prompts (None to skip image generation)
+        images_dir: Directory to save generated images
 
-def run_pipeline(title: str, output_dir: str = "output", mode: str = "video") -> str:
+    Returns:
+        Paths to the generated images (empty when images are skipped)
+    """
+    tasks = [asyncio.to_thread(generate_voiceover, narration, voiceover_path)]
+    if visual_suggestions:
+        # Only image mode needs the Stability.AI client
+        from gen_images import generate_images_for_short
+
+        tasks.append(asyncio.to_thread(
+            generate_images_for_short,
+            visual_suggestions,
+            output_dir=images_dir,
+        ))
+
+    results = await asyncio.gather(*tasks)
+    return results[1] if visual_suggestions else []
+
+
+async def run_pipeline(title: str, output_dir: str = "output", mode: str = "video") -> str:
     """
     Run the complete YouTube Shorts generation pipeline.
 
+    Blocking API and encoding calls run in worker threads so independent
+    stages can overlap on the event loop.
+
     Args:
         title: The topic/title for the short
         output_dir: Directory for output files
@@ -60,8 +99,23 @@ def run_pipeline(title: str, output_dir: str = "output", mode: str = "video") ->
 
     include_visuals = (mode == "images")
 
+    script_task = asyncio.to_thread(generate_script, title, include_visuals=include_visuals)
+
+    index_result = None
     try:
-        script_data = generate_script(title, include_visuals=include_visuals)
+        if mode == "video":
+            # Refresh the asset index (ffprobe on new files) while the LLM call
+            # is in flight, so assembly reads durations straight from disk.
+            # Each result is checked on its own so a failure names its step
+            script_data, index_result = await asyncio.gather(
+                script_task,
+                asyncio.to_thread(lambda: get_video_metadata(get_available_videos())),
+                return_exceptions=True,
+            )
+            if isinstance(script_data, BaseException):
+                raise script_data
+        else:
+            script_data = await script_task
         print(f"  Hook: {script_data['hook'][:50]}...")
         print(f"  Duration estimate: {script_data['duration_estimate']}s")
         print(f"  Word count: {len(script_data['narration'].split())} words")
@@ -71,28 +125,24 @@ def run_pipeline(title: str, output_dir: str = "output", mode: str = "video") ->
         print(f"  Script generation failed: {e}")
         raise
 
-    # ========== STEP 2: Generate Voiceover ==========
+    if isinstance(index_result, BaseException):
+        print(f"  Asset indexing failed: {index_result}")
+        raise index_result
+
+    # ========== STEP 2: Generate Voiceover (+ Images) ==========
+    # Voiceover and images only depend on the script, so they run concurrently
     print("\n" + "-" * 50)
-    print("STEP 2: Generating Voiceover")
+    if mode == "images":
+        print("STEP 2: Generating Voiceover and AI Images")
+    else:
+        print("STEP 2: Generating Voiceover")
     print("-" * 50)
 
     voiceover_path = f"{output_dir}/{slug}_{timestamp}_voice.mp3"
 
-    try:
-        generate_voiceover(script_data["narration"], voiceover_path)
-        file_size = os.path.getsize(voiceover_path) / 1024
-        print(f"  File size: {file_size:.1f} KB")
-    except Exception as e:
-        print(f"  Voiceover generation failed: {e}")
-        raise
-
-    # ========== STEP 2.5: Generate Images (if image mode) ==========
     images_dir = None
+    visual_suggestions = None
     if mode == "images":
-        print("\n" + "-" * 50)
-        print("STEP 2.5: Generating AI Images")
-        print("-" * 50)
-
         images_dir = f"{output_dir}/{slug}_{timestamp}_images"
         visual_suggestions = script_data.get("visual_suggestions", [])
 
@@ -100,15 +150,20 @@ def run_pipeline(title: str, output_dir: str = "output", mode: str = "video") ->
             print("  ERROR: No visual suggestions in script data")
             raise ValueError("No visual suggestions generated for image mode")
 
-        try:
-            image_paths = generate_images_for_short(
-                visual_suggestions,
-                output_dir=images_dir,
-            )
+    try:
+        image_paths = await generate_media(
+            script_data["narration"],
+            voiceover_path,
+            visual_suggestions,
+            images_dir,
+        )
+        file_size = os.path.getsize(voiceover_path) / 1024
+        print(f"  Voiceover file size: {file_size:.1f} KB")
+        if images_dir:
             print(f"  Generated {len(image_paths)} images")
-        except Exception as e:
-            print(f"  Image generation failed: {e}")
-            raise
+    except Exception as e:
+        print(f"  Voiceover/image generation failed: {e}")
+        raise
 
     # ========== STEP 3: Assemble Video ==========
     print("\n" + "-" * 50)
@@ -118,7 +173,8 @@ def run_pipeline(title: str, output_dir: str = "output", mode: str = "video") ->
     video_path = f"{output_dir}/{slug}_{timestamp}.mp4"
 
     try:
-        assemble_video(
+        await asyncio.to_thread(
+            assemble_video,
             voiceover_path,
             video_path,
             mode=mode,
@@ -233,9 +289,20 @@ def main():
         default=None,
         help="Visual mode: 'video' for video clips, 'images' for AI-generated images (default: prompt)"
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only show stage banners, warnings and errors"
+    )
 
     args = parser.parse_args()
 
+    # Assembly progress goes through the "shortsyt" logger; per-clip detail is DEBUG
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="%(message)s",
+    )
+
     # Check for required environment variables
     required_vars = ["CLAUDE_API_KEY", "ELEVEN_LABS_API"]
 
@@ -287,11 +354,11 @@ def main():
 
     # Run the pipeline
     try:
-        video_path = run_pipeline(
+        video_path = asyncio.run(run_pipeline(
             title=title,
             output_dir=args.output_dir,
             mode=mode,
-        )
+        ))
         print(f"\nSuccess! Watch your Short at: {video_path}")
 
     except Exception as e:
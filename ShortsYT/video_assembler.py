@@ -1,25 +1,43 @@
 """Assemble vertical video for YouTube Shorts."""
 
 import os
+import json
 import random
+import hashlib
+import logging
+import functools
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
 
-from moviepy import (
-    VideoFileClip,
-    AudioFileClip,
-    ImageClip,
-    concatenate_videoclips,
-    ColorClip,
-)
-from moviepy.video.fx import FadeIn, FadeOut
+import numpy as np
+
+log = logging.getLogger("shortsyt")
 
 # Shorts-specific settings
 RESOLUTION = (1080, 1920)  # Vertical 9:16 aspect ratio
 CLIP_DURATION_RANGE = (2, 5)  # 2-5 seconds per clip
-VIDEO_EXTENSIONS = ['.mp4', '.mov', '.avi', '.mkv', '.webm', '.m4v']
+FPS = 30
+FADE_DURATION = 0.3
+VIDEO_BITRATE = "8M"  # Higher bitrate for Shorts quality
+AUDIO_BITRATE = "192k"
+
+# assemble_many() renders at most this many shorts at once (and never more
+# than half the CPU cores, since every render is already a multi-threaded ffmpeg)
+MAX_PARALLEL_RENDERS = 4
+
+# H.264 encoders in order of preference, with their tuning options.
+# Hardware encoders are used when this machine can actually run them.
+VIDEO_ENCODERS = [
+    ("h264_nvenc", ["-preset", "p4", "-tune", "hq", "-rc", "vbr"]),  # NVIDIA
+    ("h264_videotoolbox", []),  # macOS
+    ("h264_qsv", ["-preset", "veryfast"]),  # Intel Quick Sync
+    ("libx264", ["-preset", "veryfast"]),  # CPU fallback
+]
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm', '.m4v'})
 
 # Image mode settings
-PHOTO_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp', '.bmp']
+PHOTO_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.bmp'})
 ZOOM_RATIO = 1.15  # How much larger than frame (15% zoom margin for Ken Burns)
 EFFECTS = [
     "pan_up",
@@ -28,93 +46,399 @@ EFFECTS = [
     "zoom_out",
 ]
 
+# ffmpeg zoompan arguments per effect, applied to a cover-fit 1080x1920 frame.
+# {zoom} is ZOOM_RATIO and {d} the number of frames the image is shown for;
+# `on` is zoompan's output frame counter.
+KEN_BURNS = {
+    # Zoomed in, panning from the bottom edge to the top edge
+    "pan_up": "z={zoom}:x='iw/2-iw/zoom/2':y='(ih-ih/zoom)*(1-on/{d})'",
+    # Zoomed in, panning from the top edge to the bottom edge
+    "pan_down": "z={zoom}:x='iw/2-iw/zoom/2':y='(ih-ih/zoom)*on/{d}'",
+    # Centered, 1.0 -> ZOOM_RATIO
+    "zoom_in": "z='1+({zoom}-1)*on/{d}':x='iw/2-iw/zoom/2':y='ih/2-ih/zoom/2'",
+    # Centered, ZOOM_RATIO -> 1.0
+    "zoom_out": "z='{zoom}-({zoom}-1)*on/{d}':x='iw/2-iw/zoom/2':y='ih/2-ih/zoom/2'",
+}
+
 # Assets path (shared with parent LongFormYT)
 ASSETS_DIR = Path(__file__).parent.parent / "assets" / "videos"
 
+# Source videos pre-cut to 1080x1920@30 (one file per source version)
+MEZZANINE_DIR = ASSETS_DIR.parent / "_cache"
+
+# Probed duration/size per asset file, shared with the long-form AssetManager
+ASSET_INDEX_PATH = ASSETS_DIR / ".index.json"
+
+
+def _scan_files(directory: Path, extensions: frozenset) -> list[Path]:
+    """List files in directory whose extension (any case) is in extensions, sorted."""
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(entry.path) for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+
 
 def get_available_videos() -> list[Path]:
     """Get all video files from the shared assets folder."""
-    videos = []
-    for ext in VIDEO_EXTENSIONS:
-        videos.extend(ASSETS_DIR.glob(f"*{ext}"))
-        videos.extend(ASSETS_DIR.glob(f"*{ext.upper()}"))
-    return sorted(videos)
+    return _scan_files(ASSETS_DIR, VIDEO_EXTENSIONS)
 
 
 def get_generated_images(images_dir: str) -> list[Path]:
     """Get all generated images from directory, sorted by filename."""
-    images_path = Path(images_dir)
-    if not images_path.exists():
-        return []
+    return _scan_files(Path(images_dir), PHOTO_EXTENSIONS)
+
+
+def run_ffmpeg(args: list[str]):
+    """Run ffmpeg with the given arguments, raising RuntimeError on failure."""
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", *args]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {result.stderr.strip()[-2000:]}")
+
+
+# (path, mtime_ns) -> (duration, (width, height)); a replaced file gets a new key
+_probe_cache: dict[tuple[str, int], tuple[float, tuple[int, int]]] = {}
+
+
+def probe_media(path: Path) -> tuple[float, tuple[int, int]]:
+    """
+    Read duration and frame size from the container headers with ffprobe.
+
+    Nothing is decoded. Audio-only files report a (0, 0) frame size.
+    Results are memoized per (path, mtime).
+
+    Returns:
+        Tuple of (duration in seconds, (width, height))
+    """
+    key = (str(path), os.stat(path).st_mtime_ns)
+    if key in _probe_cache:
+        return _probe_cache[key]
+
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "format=duration:stream=width,height",
+            "-of", "default=noprint_wrappers=1",
+            str(path),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe failed for {path}: {result.stderr.strip()}")
+
+    fields = dict(line.split("=", 1) for line in result.stdout.splitlines() if "=" in line)
+    info = (
+        float(fields["duration"]),
+        (int(fields.get("width", 0)), int(fields.get("height", 0))),
+    )
+    _probe_cache[key] = info
+    return info
 
-    images = []
-    for ext in PHOTO_EXTENSIONS:
-        images.extend(images_path.glob(f"*{ext}"))
-        images.extend(images_path.glob(f"*{ext.upper()}"))
 
-    return sorted(images)
+def _load_asset_index() -> dict:
+    """Read the asset metadata index, or start empty if it is missing or unreadable."""
+    try:
+        return json.loads(ASSET_INDEX_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
 
 
-def resize_cover_vertical(clip, target_w: int, target_h: int):
+def get_video_metadata(videos: list[Path]) -> dict[str, tuple[float, tuple[int, int]]]:
     """
-    Resize image to cover target dimensions (like CSS object-fit: cover).
+    Get duration and frame size for asset videos, probing only new or changed files.
+
+    Entries in assets/videos/.index.json are keyed by file name and reused
+    while the file's mtime and size match, so repeat runs skip ffprobe.
 
-    The image is scaled so the shorter dimension fills the target,
-    and the longer dimension overflows (will be cropped by positioning).
+    Returns:
+        Dict of path string -> (duration, (width, height))
     """
-    img_w, img_h = clip.size
-    scale = max(target_w / img_w, target_h / img_h)
-    return clip.resized(scale)
+    index = _load_asset_index()
+    metadata = {}
+    changed = False
+
+    stale_paths = []
+    for path in videos:
+        stat = path.stat()
+        entry = index.get(path.name)
+        if not entry or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            stale_paths.append((path, stat))
+
+    # ffprobe runs as a subprocess, so threads probe new files in parallel
+    if stale_paths:
+        with ThreadPoolExecutor(max_workers=min(16, len(stale_paths))) as pool:
+            probed = pool.map(lambda item: probe_media(item[0]), stale_paths)
+            for (path, stat), (duration, (width, height)) in zip(stale_paths, probed):
+                index[path.name] = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "duration": duration,
+                    "width": width,
+                    "height": height,
+                }
+        changed = True
+
+    for path in videos:
+        entry = index[path.name]
+        metadata[str(path)] = (entry["duration"], (entry["width"], entry["height"]))
+
+    # Forget files that were removed from the folder
+    names = {path.name for path in videos}
+    for stale in set(index) - names:
+        del index[stale]
+        changed = True
+
+    if changed:
+        # Per-process temp name: assemble_many() workers may write concurrently
+        tmp_path = ASSET_INDEX_PATH.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        os.replace(tmp_path, ASSET_INDEX_PATH)
+
+    return metadata
+
+
+@functools.lru_cache(maxsize=None)
+def get_video_encoder() -> tuple[str, tuple[str, ...]]:
+    """
+    Pick the fastest H.264 encoder available, falling back to libx264.
 
+    ffmpeg lists hardware encoders it was built with even when no device is
+    present, so each candidate is confirmed with a one-frame test encode.
+    The choice is made once per process.
 
-def apply_ken_burns_vertical(clip: ImageClip, effect: str, duration: float) -> ImageClip:
+    Returns:
+        Tuple of (encoder name, encoder options)
     """
-    Apply Ken Burns panning/zoom effect to an image clip for vertical format.
-    Uses percentage-based positioning for smooth, reliable panning.
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+        )
+        built_in = result.stdout
+    except OSError:
+        built_in = ""
+
+    for name, options in VIDEO_ENCODERS[:-1]:
+        if name not in built_in:
+            continue
+        probe = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                "-frames:v", "1", "-c:v", name, "-f", "null", "-",
+            ],
+            capture_output=True,
+        )
+        if probe.returncode == 0:
+            return name, tuple(options)
+
+    name, options = VIDEO_ENCODERS[-1]
+    return name, tuple(options)
+
+
+def _mezzanine_key(path: Path) -> str:
+    """Cache key for a source video: changes whenever the file is replaced or edited."""
+    stat = path.stat()
+    return hashlib.sha1(f"{path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}".encode()).hexdigest()
+
+
+def _cached_mezzanine(path: Path, width: int, height: int) -> Path:
     """
-    w, h = RESOLUTION  # 1080x1920 for vertical
-
-    # Scale image to be larger than frame for panning room
-    clip = resize_cover_vertical(clip, w, h)
-    clip = clip.resized(ZOOM_RATIO)
-    clip = clip.with_duration(duration)
-
-    if effect == "pan_up":
-        # Start from bottom (100%), pan to top (0%)
-        def position(t):
-            progress = t / duration
-            y_percent = 100 - (100 * progress)  # 100% -> 0%
-            return ('center', f'{y_percent}%')
-        clip = clip.with_position(position)
-
-    elif effect == "pan_down":
-        # Start from top (0%), pan to bottom (100%)
-        def position(t):
-            progress = t / duration
-            y_percent = 100 * progress  # 0% -> 100%
-            return ('center', f'{y_percent}%')
-        clip = clip.with_position(position)
-
-    elif effect == "zoom_in":
-        clip = clip.resized(1 / ZOOM_RATIO)  # Reset to cover-fit
-        def zoom_in_scale(t):
-            progress = t / duration
-            return 1.0 + (ZOOM_RATIO - 1.0) * progress
-        clip = clip.resized(zoom_in_scale)
-        clip = clip.with_position('center')
-
-    elif effect == "zoom_out":
-        clip = clip.resized(1 / ZOOM_RATIO)  # Reset to cover-fit
-        def zoom_out_scale(t):
-            progress = t / duration
-            return ZOOM_RATIO - (ZOOM_RATIO - 1.0) * progress
-        clip = clip.resized(zoom_out_scale)
-        clip = clip.with_position('center')
+    Return a vertical 1080x1920@30 copy of a source video, transcoding it on first use.
 
-    else:
-        clip = clip.with_position('center')
+    The copy is short-GOP H.264 without audio, so later runs can seek into it
+    cheaply and cut segments without any reframing.
+    """
+    MEZZANINE_DIR.mkdir(parents=True, exist_ok=True)
+    cached = MEZZANINE_DIR / f"{_mezzanine_key(path)}.mp4"
+    if cached.exists():
+        return cached
+
+    log.info(f"    Caching vertical copy of {path.name}...")
+    tmp = cached.with_suffix(f".{os.getpid()}.tmp.mp4")
+    run_ffmpeg([
+        "-i", str(path),
+        "-vf", f"{resize_to_vertical(width, height)},setsar=1,fps={FPS}",
+        "-c:v", "libx264",
+        "-preset", "veryfast",
+        "-crf", "18",
+        "-g", str(FPS),
+        "-pix_fmt", "yuv420p",
+        "-an",
+        str(tmp),
+    ])
+    os.replace(tmp, cached)
+    return cached
+
+
+def prune_mezzanine_cache(videos: list[Path]):
+    """Delete cached copies that no longer match any current source video."""
+    if not MEZZANINE_DIR.exists():
+        return
+    keep = {f"{_mezzanine_key(path)}.mp4" for path in videos}
+    for cached in MEZZANINE_DIR.glob("*.mp4"):
+        # Skip copies another process is still writing
+        if cached.name not in keep and not cached.name.endswith(".tmp.mp4"):
+            cached.unlink(missing_ok=True)
+
+
+def render_short(
+    inputs: list[list[str]],
+    chains: list[str],
+    voiceover_path: str,
+    output_path: str,
+    total_duration: float,
+):
+    """
+    Concatenate visual inputs under the voiceover and encode the short in one ffmpeg run.
+
+    Args:
+        inputs: ffmpeg input arguments per visual, in order (input i is [i:v])
+        chains: Filter chains turning [i:v] into 1080x1920@30 [v<i>], one per input
+        voiceover_path: Audio track for the short
+        output_path: Path to save the final video
+        total_duration: Length of the voiceover in seconds
+    """
+    # Input 0 is the voiceover
+    args = ["-i", voiceover_path]
+    for input_args in inputs:
+        args += input_args
+
+    labels = "".join(f"[v{i}]" for i in range(1, len(inputs) + 1))
+    fade_out_start = max(0.0, total_duration - FADE_DURATION)
+    graph = ";".join(chains + [
+        f"{labels}concat=n={len(inputs)}:v=1:a=0,"
+        f"fade=t=in:st=0:d={FADE_DURATION},"
+        f"fade=t=out:st={fade_out_start:.3f}:d={FADE_DURATION}[outv]"
+    ])
+
+    encoder, encoder_options = get_video_encoder()
+    log.info(f"  Encoder: {encoder}")
+
+    args += [
+        "-filter_complex", graph,
+        "-map", "[outv]",
+        "-map", "0:a",
+        "-t", f"{total_duration:.3f}",
+        "-r", str(FPS),
+        "-c:v", encoder,
+        *encoder_options,
+        "-b:v", VIDEO_BITRATE,
+        "-pix_fmt", "yuv420p",
+        "-c:a", "aac",
+        "-b:a", AUDIO_BITRATE,
+        "-movflags", "+faststart",
+        output_path,
+    ]
+    run_ffmpeg(args)
 
-    return clip
+
+def video_segment_inputs(
+    segments: list[tuple[str, float, float]],
+) -> tuple[list[list[str]], list[str]]:
+    """
+    Build render_short inputs for cuts from vertical source videos.
+
+    Args:
+        segments: (1080x1920 source path, start, duration) per cut, in order
+    """
+    inputs = []
+    chains = []
+    for i, (path, start, duration) in enumerate(segments, 1):
+        # Seek on the demuxer side so only the needed span is decoded
+        inputs.append(["-ss", f"{start:.3f}", "-t", f"{duration:.3f}", "-i", path])
+        chains.append(f"[{i}:v]setsar=1,fps={FPS},setpts=PTS-STARTPTS[v{i}]")
+    return inputs, chains
+
+
+def ken_burns_inputs(
+    images: list[tuple[str, str, int]],
+) -> tuple[list[list[str]], list[str]]:
+    """
+    Build render_short inputs that animate still images with zoompan.
+
+    Args:
+        images: (image path, effect name, frame count) per image, in order
+    """
+    w, h = RESOLUTION
+    inputs = []
+    chains = []
+    for i, (path, effect, frames) in enumerate(images, 1):
+        motion = KEN_BURNS.get(effect, "z=1").format(zoom=ZOOM_RATIO, d=frames)
+        # A single decoded frame; zoompan emits `frames` output frames from it
+        inputs.append(["-i", path])
+        chains.append(
+            f"[{i}:v]scale={w}:{h}:force_original_aspect_ratio=increase:flags=lanczos,crop={w}:{h},"
+            f"setsar=1,zoompan={motion}:d={frames}:s={w}x{h}:fps={FPS},"
+            f"setpts=PTS-STARTPTS[v{i}]"
+        )
+    return inputs, chains
+
+
+def plan_cuts(
+    video_paths: list[str],
+    sources: dict[str, tuple[float, tuple[int, int]]],
+    total_duration: float,
+    rng: np.random.Generator = None,
+) -> list[tuple[str, float, float]]:
+    """
+    Draw the random fast-cut schedule covering total_duration.
+
+    Cut lengths are uniform in CLIP_DURATION_RANGE, and a remainder under
+    0.5s is absorbed by the last cut. Each cut comes from a random source
+    at a random start that keeps it inside the source. A cut longer than
+    its source is shortened to fit and the missing footage is carried into
+    the next cut, so the cuts always add up to total_duration.
+
+    Args:
+        video_paths: Candidate source videos
+        sources: Path -> (duration, frame size), as from get_video_metadata
+        total_duration: Seconds of video needed
+        rng: Random generator (default: a fresh numpy Generator)
+
+    Returns:
+        List of (source path, start, duration) per cut, in order
+
+    Raises:
+        ValueError: If total_duration is not positive or every source is
+            under 0.5s
+    """
+    if total_duration <= 0:
+        raise ValueError(f"Cannot plan cuts for a {total_duration:.2f}s voiceover")
+
+    usable = [path for path in video_paths if sources[path][0] > 0.5]
+    if not usable:
+        raise ValueError("All source videos are too short to cut from")
+
+    rng = rng or np.random.default_rng()
+    low, high = CLIP_DURATION_RANGE
+
+    cuts = []
+    covered = 0.0
+    shortfall = 0.0
+    while total_duration - covered > 1 / FPS:
+        path = usable[rng.integers(len(usable))]
+        source_duration = sources[path][0]
+        remaining = total_duration - covered
+
+        wanted = rng.uniform(low, high) + shortfall
+        if remaining - wanted < 0.5:  # Don't leave a sliver for the last cut
+            wanted = remaining
+        length = min(wanted, source_duration)
+        shortfall = wanted - length
+
+        start = rng.uniform(0.0, source_duration - length)
+        cuts.append((path, float(start), float(length)))
+        covered += length
+
+    return cuts
 
 
 def assemble_video(
@@ -135,20 +459,18 @@ def assemble_video(
     Returns:
         Path to the generated video
     """
-    print(f"Starting video assembly (mode: {mode})...")
+    log.info(f"Starting video assembly (mode: {mode})...")
 
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    # Load voiceover to get duration
-    print(f"  Loading voiceover: {voiceover_path}")
-    voiceover = AudioFileClip(voiceover_path)
-    total_duration = voiceover.duration
-    print(f"  Duration: {total_duration:.1f}s")
-
-    video_clips = []
-    source_clips = {}  # For cleanup later
+    # Probe voiceover to get duration
+    log.info(f"  Loading voiceover: {voiceover_path}")
+    total_duration, _ = probe_media(voiceover_path)
+    log.info(f"  Duration: {total_duration:.1f}s")
 
+    # Visuals are planned in Python and rendered by a single ffmpeg call;
+    # frames never pass through Python
     if mode == "images":
         # ========== IMAGE MODE ==========
         if not images_dir:
@@ -158,171 +480,138 @@ def assemble_video(
         if not images:
             raise FileNotFoundError(f"No images found in {images_dir}")
 
-        print(f"  Found {len(images)} generated image(s)")
+        log.info(f"  Found {len(images)} generated image(s)")
 
         # Calculate duration per image
         image_duration = total_duration / len(images)
-        print(f"  Duration per image: {image_duration:.1f}s")
+        log.info(f"  Duration per image: {image_duration:.1f}s")
+
+        log.info(f"\n  Creating image clips with Ken Burns effects...")
 
-        print(f"\n  Creating image clips with Ken Burns effects...")
+        # Whole frames per image; the last image absorbs the rounding remainder
+        total_frames = max(len(images), round(total_duration * FPS))
+        frames_per_image = total_frames // len(images)
 
+        planned = []
         for i, image_path in enumerate(images, 1):
             effect = random.choice(EFFECTS)
-            print(f"    Image {i}/{len(images)}: {image_path.name} [{effect}]")
-
-            try:
-                clip = ImageClip(str(image_path))
-                clip = clip.with_duration(image_duration)
-                clip = apply_ken_burns_vertical(clip, effect, image_duration)
-                video_clips.append(clip)
-
-            except Exception as e:
-                print(f"      Error: {e}")
-                # Fallback to black clip
-                fallback = ColorClip(
-                    size=RESOLUTION,
-                    color=(0, 0, 0),
-                    duration=image_duration,
-                )
-                video_clips.append(fallback)
+            log.debug(f"    Image {i}/{len(images)}: {image_path.name} [{effect}]")
+
+            frames = frames_per_image
+            if i == len(images):
+                frames = total_frames - frames_per_image * (len(images) - 1)
+            planned.append((str(image_path), effect, frames))
 
-        print(f"\n  Created {len(video_clips)} image clips")
+        log.info(f"\n  Created {len(planned)} image clips ({frames_per_image} frames each)")
+        inputs, chains = ken_burns_inputs(planned)
 
     else:
-        # ========== VIDEO MODE (existing logic) ==========
-        # Get available videos
+        # ========== VIDEO MODE ==========
         available_videos = get_available_videos()
         if not available_videos:
             raise FileNotFoundError(f"No videos found in {ASSETS_DIR}")
 
-        print(f"  Found {len(available_videos)} source video(s)")
+        log.info(f"  Found {len(available_videos)} source video(s)")
+        prune_mezzanine_cache(available_videos)
 
-        # Load all source videos
+        # Source metadata (duration, frame size) from the asset index
+        sources = get_video_metadata(available_videos)
         for video_path in available_videos:
-            clip = VideoFileClip(str(video_path))
-            source_clips[str(video_path)] = clip
-            print(f"    Loaded: {video_path.name} ({clip.duration:.1f}s)")
-
-        video_paths = list(source_clips.keys())
+            log.debug(f"    Found: {video_path.name} ({sources[str(video_path)][0]:.1f}s)")
 
-        # Create fast cuts until we have enough duration
-        print(f"\n  Creating fast cuts...")
-        current_duration = 0
-        clip_count = 0
+        video_paths = list(sources.keys())
 
-        while current_duration < total_duration:
-            # Random clip duration between 2-5 seconds
-            clip_duration = random.uniform(*CLIP_DURATION_RANGE)
+        # Plan every cut up front, then transcode the sources it uses
+        log.info(f"\n  Creating fast cuts...")
+        schedule = plan_cuts(video_paths, sources, total_duration)
 
-            # Don't exceed total duration
-            if current_duration + clip_duration > total_duration:
-                clip_duration = total_duration - current_duration
+        segments = []
+        mezzanines = {}  # source path -> cached vertical copy
+        for n, (selected_video_path, start, clip_duration) in enumerate(schedule, 1):
+            log.debug(f"    Clip {n}: {Path(selected_video_path).name} [{start:.1f}s - {start + clip_duration:.1f}s] ({clip_duration:.1f}s)")
 
-            if clip_duration < 0.5:  # Skip very short clips
-                break
-
-            # Randomly select which video to use
-            selected_video_path = random.choice(video_paths)
-            selected_clip = source_clips[selected_video_path]
-
-            # Random start position in the video
-            max_start = max(0, selected_clip.duration - clip_duration)
-            start = random.uniform(0, max_start)
-            end = start + clip_duration
+            # Only sources that are actually used get transcoded
+            if selected_video_path not in mezzanines:
+                _, (width, height) = sources[selected_video_path]
+                mezzanines[selected_video_path] = str(
+                    _cached_mezzanine(Path(selected_video_path), width, height)
+                )
 
-            clip_count += 1
-            print(f"    Clip {clip_count}: {Path(selected_video_path).name} [{start:.1f}s - {end:.1f}s] ({clip_duration:.1f}s)")
+            segments.append((mezzanines[selected_video_path], start, clip_duration))
 
-            try:
-                # Extract clip
-                clip = selected_clip.subclipped(start, end)
+        current_duration = sum(clip_duration for _, _, clip_duration in schedule)
+        log.info(
+            f"\n  Created {len(segments)} clips from {len(mezzanines)} "
+            f"source video(s), {current_duration:.1f}s total"
+        )
+        inputs, chains = video_segment_inputs(segments)
 
-                # Resize to vertical format (crop to center if needed)
-                clip = resize_to_vertical(clip)
+    # Concatenate, fade in/out, attach voiceover and encode
+    log.info(f"  Rendering to {output_path}...")
+    render_short(inputs, chains, voiceover_path, output_path, total_duration)
 
-                video_clips.append(clip)
-                current_duration += clip_duration
+    log.info(f"\n  Done! Video saved to: {output_path}")
+    return output_path
 
-            except Exception as e:
-                print(f"      Error: {e}")
-                # Fallback to black clip
-                fallback = ColorClip(
-                    size=RESOLUTION,
-                    color=(0, 0, 0),
-                    duration=clip_duration,
-                )
-                video_clips.append(fallback)
-                current_duration += clip_duration
 
-        print(f"\n  Created {len(video_clips)} clips")
+def _assemble_job(job: dict) -> str:
+    """Run one assemble_many() job in a worker process."""
+    return assemble_video(**job)
 
-    # Concatenate all clips
-    print("  Concatenating clips...")
-    final_video = concatenate_videoclips(video_clips, method="compose")
 
-    # Add subtle fade in/out
-    final_video = final_video.with_effects([
-        FadeIn(0.3),
-        FadeOut(0.3),
-    ])
+def assemble_many(jobs: list[dict]) -> list[str]:
+    """
+    Assemble several shorts in parallel worker processes.
 
-    # Attach voiceover
-    print("  Attaching voiceover...")
-    final_video = final_video.with_audio(voiceover)
+    Args:
+        jobs: assemble_video keyword arguments per short (voiceover_path,
+            output_path and optionally mode/images_dir)
 
-    # Render
-    print(f"  Rendering to {output_path}...")
-    final_video.write_videofile(
-        output_path,
-        fps=30,
-        codec="libx264",
-        audio_codec="aac",
-        bitrate="8000k",  # Higher bitrate for Shorts quality
-        audio_bitrate="192k",
-        threads=4,
-    )
+    Returns:
+        Paths to the generated videos, in job order
+    """
+    if not jobs:
+        return []
 
-    # Cleanup
-    final_video.close()
-    voiceover.close()
-    for source_clip in source_clips.values():
-        source_clip.close()
-    for clip in video_clips:
-        clip.close()
+    # Probe new asset videos once up front so workers all read a warm index
+    if any(job.get("mode", "video") == "video" for job in jobs):
+        get_video_metadata(get_available_videos())
 
-    print(f"\n  Done! Video saved to: {output_path}")
-    return output_path
+    workers = max(1, min(MAX_PARALLEL_RENDERS, (os.cpu_count() or 2) // 2, len(jobs)))
+    log.info(f"Assembling {len(jobs)} shorts with {workers} worker(s)...")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_assemble_job, jobs))
 
 
-def resize_to_vertical(clip: VideoFileClip) -> VideoFileClip:
+def resize_to_vertical(width: int, height: int) -> str:
     """
-    Resize and crop a video clip to vertical 9:16 format.
+    Build the ffmpeg filter that crops and scales a width x height source to 9:16.
 
-    Centers the crop on the original video.
+    Centers the crop on the original video. Steps that would be no-ops are
+    left out, so an exact 1080x1920 source gets the pass-through "null" filter.
     """
     target_width, target_height = RESOLUTION
-    target_ratio = target_width / target_height  # 0.5625 for 9:16
+    filters = []
 
-    original_width, original_height = clip.size
-    original_ratio = original_width / original_height
-
-    if original_ratio > target_ratio:
+    # Compare aspect ratios by cross-multiplying to stay in integer math
+    if width * target_height > height * target_width:
         # Video is wider than target - crop sides
-        new_width = int(original_height * target_ratio)
-        x_center = original_width // 2
-        x1 = x_center - new_width // 2
-        clip = clip.cropped(x1=x1, x2=x1 + new_width)
-    else:
+        new_width = height * target_width // target_height
+        x1 = (width - new_width) // 2
+        filters.append(f"crop={new_width}:{height}:{x1}:0")
+        width = new_width
+    elif width * target_height < height * target_width:
         # Video is taller than target - crop top/bottom
-        new_height = int(original_width / target_ratio)
-        y_center = original_height // 2
-        y1 = y_center - new_height // 2
-        clip = clip.cropped(y1=y1, y2=y1 + new_height)
+        new_height = width * target_height // target_width
+        y1 = (height - new_height) // 2
+        filters.append(f"crop={width}:{new_height}:0:{y1}")
+        height = new_height
 
     # Resize to exact target resolution
-    clip = clip.resized(RESOLUTION)
+    if (width, height) != RESOLUTION:
+        filters.append(f"scale={target_width}:{target_height}:flags=lanczos")
 
-    return clip
+    return ",".join(filters) or "null"
 
 
 if __name__ == "__main__":
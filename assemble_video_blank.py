@@ -19,7 +19,9 @@ import sys
 import os
 import argparse
 from pathlib import Path
-from moviepy import ColorClip, AudioFileClip
+
+from video_assembler.config import pick_video_encoder
+from video_assembler.ffmpeg_utils import run_ffmpeg, probe_media
 
 
 def generate_blank_video(
@@ -48,40 +50,51 @@ def generate_blank_video(
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    # Load audio to get duration
-    print("\nLoading audio...")
-    audio = AudioFileClip(voiceover_path)
-    duration = audio.duration
+    # Duration comes from the container headers; nothing is decoded
+    print("\nProbing audio...")
+    try:
+        duration, _ = probe_media(voiceover_path)
+    except (RuntimeError, ValueError, KeyError):
+        # ffprobe couldn't report a duration, let MoviePy work it out
+        from moviepy import AudioFileClip
+
+        audio = AudioFileClip(voiceover_path)
+        duration = audio.duration
+        audio.close()
     print(f"  Duration: {duration:.1f}s ({duration/60:.1f} minutes)")
 
-    # Create blank video clip
-    print("\nCreating blank video clip...")
-    video = ColorClip(
-        size=resolution,
-        color=background_color,
-        duration=duration,
+    # Blank frames come straight from ffmpeg's color source; no frame ever
+    # passes through Python
+    width, height = resolution
+    red, green, blue = background_color
+    color_source = (
+        f"color=c=0x{red:02x}{green:02x}{blue:02x}:s={width}x{height}"
+        f":r=30:d={duration:.3f}"
     )
 
-    # Attach audio
-    print("Attaching audio...")
-    video = video.with_audio(audio)
-    video = video.with_fps(30)
+    codec, codec_params = pick_video_encoder()
+    if codec == "libx264":
+        # x264 spots the static picture and encodes it at close to disk speed
+        video_params = ["-preset", "ultrafast", "-tune", "stillimage"]
+    else:
+        video_params = [*codec_params, "-b:v", "5000k"]
 
     # Render video
-    print(f"\nRendering to {output_path}...")
-    video.write_videofile(
+    print(f"\nRendering to {output_path} ({codec})...")
+    run_ffmpeg([
+        "-f", "lavfi", "-i", color_source,
+        "-i", voiceover_path,
+        "-map", "0:v",
+        "-map", "1:a",
+        "-c:v", codec,
+        *video_params,
+        "-pix_fmt", "yuv420p",
+        "-c:a", "aac",
+        "-b:a", "192k",
+        "-shortest",
+        "-movflags", "+faststart",
         output_path,
-        fps=30,
-        codec="libx264",
-        audio_codec="aac",
-        bitrate="5000k",
-        audio_bitrate="192k",
-        threads=4,
-    )
-
-    # Cleanup
-    video.close()
-    audio.close()
+    ])
 
     print(f"\n✅ Done! Video saved to: {output_path}")
     return output_path
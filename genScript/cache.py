@@ -0,0 +1,53 @@
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+
+from genScript.genScript import (
+    SCRIPT_INSTRUCTIONS,
+    SCRIPT_MODEL,
+    MAX_TRANSCRIPT_TOKENS,
+    generate_script,
+)
+
+# Generated scripts persist here so re-running a title skips the LLM call;
+# anchored to the repo so every entry point shares it from any working dir
+SCRIPT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "scripts"
+
+# Editing the model, the instructions or the transcript budget changes every
+# key, so scripts from an older prompt are never served
+MODEL_VER = hashlib.sha256(
+    f"{SCRIPT_MODEL}|{MAX_TRANSCRIPT_TOKENS}|{SCRIPT_INSTRUCTIONS}".encode()
+).hexdigest()[:16]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize_title(title: str) -> str:
+    """Case and spacing variants of a title map to one key; punctuation is kept."""
+    return _WHITESPACE.sub(" ", title.casefold()).strip()
+
+
+def cached_generate_script(title: str, transcript: str = "", force: bool = False) -> dict:
+    """
+    generate_script(title, transcript), reusing the saved result for equivalent inputs.
+
+    With force=True the saved result is ignored and replaced by a fresh one.
+    """
+    key = hashlib.sha256(
+        f"{MODEL_VER}|{_normalize_title(title)}|{transcript}".encode()
+    ).hexdigest()
+    cache_path = SCRIPT_CACHE_DIR / f"{key}.json"
+    if not force and cache_path.exists():
+        print("  (using cached script)")
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+
+    script_data = generate_script(title, transcript)
+
+    SCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(script_data), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+    return script_data
@@ -1,20 +1,24 @@
 import os
 import json
 import re
+import functools
+from pathlib import Path
 from pydantic import BaseModel, ValidationError
-from agents import Agent, Runner, ModelSettings, set_tracing_export_api_key
-from agents.extensions.models.litellm_model import LitellmModel
 from dotenv import load_dotenv
 
-load_dotenv()
+try:
+    import orjson  # optional C JSON codec for saving/loading scripts
+except ImportError:
+    orjson = None
 
-# Enable tracing to OpenAI dashboard with your OpenAI API key
-openai_api_key = os.environ.get("OPENAI_API_KEY")
-if openai_api_key:
-    set_tracing_export_api_key(openai_api_key)
+try:
+    import tiktoken  # token-accurate transcript truncation
+except ImportError:
+    tiktoken = None
 
-api_key = os.environ["GEMINI_API_KEY"]
-claude_api_key = os.environ["CLAUDE_API_KEY"]
+# .env is loaded by the entry point; running this file directly makes it one
+if __name__ == "__main__":
+    load_dotenv()
 
 
 # Pydantic models for structured output
@@ -30,6 +34,32 @@ class ScriptOutput(BaseModel):
     scenes: list[Scene]
 
 
+def load_script(path) -> ScriptOutput:
+    """Load a saved script file, parsing and validating the raw bytes in one pass."""
+    return ScriptOutput.model_validate_json(Path(path).read_bytes())
+
+
+def load_trusted_script(path) -> ScriptOutput:
+    """
+    Load a script file this pipeline wrote itself, skipping validation.
+
+    generate_script already validated the content before it was saved, so
+    the models are built directly. Use load_script for files of unknown origin.
+    """
+    raw_bytes = Path(path).read_bytes()
+    raw = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
+    return ScriptOutput.model_construct(
+        script=raw["script"],
+        duration_estimate=raw["duration_estimate"],
+        scenes=[Scene.model_construct(**scene) for scene in raw["scenes"]],
+    )
+
+
+# JSON inside a markdown code block, or failing that the outermost {...} span
+_FENCED_JSON = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+_JSON_OBJECT = re.compile(r'\{.*\}', re.S)
+
+
 def parse_script_output(raw_output: str) -> dict:
     """
     Parse the model's output, handling the $PARAMETER_NAME wrapper issue.
@@ -39,15 +69,23 @@ def parse_script_output(raw_output: str) -> dict:
     """
     # First, try to extract JSON from the raw output
     # Handle case where output might have markdown code blocks
-    json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', raw_output)
+    text = raw_output
+    json_match = _FENCED_JSON.search(text)
     if json_match:
-        raw_output = json_match.group(1)
+        text = json_match.group(1)
 
     # Try to parse as JSON
     try:
-        parsed = json.loads(raw_output.strip())
+        parsed = json.loads(text.strip())
     except json.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse JSON: {e}")
+        # Prose around the JSON (no fences): retry on the {...} block alone
+        object_match = _JSON_OBJECT.search(raw_output)
+        if not object_match:
+            raise ValueError(f"Failed to parse JSON: {e}")
+        try:
+            parsed = json.loads(object_match.group(0))
+        except json.JSONDecodeError:
+            raise ValueError(f"Failed to parse JSON: {e}")
 
     # Check if it's wrapped in $PARAMETER_NAME or similar template key
     if isinstance(parsed, dict) and len(parsed) == 1:
@@ -66,12 +104,8 @@ def parse_script_output(raw_output: str) -> dict:
         raise ValueError(f"Invalid script output structure: {e}")
 
 
-# Agent with instructions for anime/entertainment script generation
-agent = Agent(
-    name="ScriptWriter",
-    model=LitellmModel(model="anthropic/claude-sonnet-4-5", api_key=claude_api_key),
-    model_settings=ModelSettings(include_usage=True),
-    instructions="""You are an expert anime/entertainment YouTube script writer.
+# Instructions for anime/entertainment script generation
+SCRIPT_INSTRUCTIONS = """You are an expert anime/entertainment YouTube script writer.
 
 CRITICAL OUTPUT FORMAT:
 - Output ONLY the raw JSON object with script, duration_estimate, and scenes
@@ -119,10 +153,78 @@ Create engaging, fun content with:
 - Attention-grabbing hook in first scene
 - Good pacing and transitions
 - Entertaining narration style
-- Photo suggestions that visually represent each scene's key concept""",
-    # Note: output_type removed to handle JSON parsing manually
-    # The LitellmModel sometimes wraps output in {"$PARAMETER_NAME": {...}}
-)
+- Photo suggestions that visually represent each scene's key concept"""
+
+SCRIPT_MODEL = "anthropic/claude-sonnet-4-5"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_agent():
+    """
+    Build the script-writing agent on first use and reuse it afterwards.
+
+    Nothing is imported or configured until a script is actually generated,
+    so loading saved scripts never needs agents/litellm or API keys.
+    """
+    from agents import Agent, ModelSettings, set_tracing_export_api_key
+    from agents.extensions.models.litellm_model import LitellmModel
+
+    # Enable tracing to OpenAI dashboard with your OpenAI API key
+    openai_api_key = os.environ.get("OPENAI_API_KEY")
+    if openai_api_key:
+        set_tracing_export_api_key(openai_api_key)
+
+    return Agent(
+        name="ScriptWriter",
+        model=LitellmModel(
+            model=SCRIPT_MODEL,
+            api_key=os.environ["CLAUDE_API_KEY"],
+        ),
+        model_settings=ModelSettings(include_usage=True),
+        instructions=SCRIPT_INSTRUCTIONS,
+        # Note: output_type removed to handle JSON parsing manually
+        # The LitellmModel sometimes wraps output in {"$PARAMETER_NAME": {...}}
+    )
+
+
+# Transcript budget sent to the model (roughly the old 10000-char cap)
+MAX_TRANSCRIPT_TOKENS = 2500
+MAX_TRANSCRIPT_CHARS = 10000  # used when tiktoken isn't installed
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tokenizer once per process."""
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def truncate_transcript(transcript: str) -> str:
+    """Cut a transcript down to MAX_TRANSCRIPT_TOKENS tokens, marking the cut with '...'."""
+    if tiktoken is None:
+        print(f"  [DEBUG] Transcript length: {len(transcript)} chars")
+        if len(transcript) <= MAX_TRANSCRIPT_CHARS:
+            return transcript
+        print(f"  [DEBUG] Truncating transcript from {len(transcript)} to {MAX_TRANSCRIPT_CHARS} chars")
+        return transcript[:MAX_TRANSCRIPT_CHARS] + "..."
+
+    encoding = _get_encoding()
+    tokens = encoding.encode(transcript)
+    # The token ids double as the size report, no separate word split needed
+    print(f"  [DEBUG] Transcript length: {len(transcript)} chars, {len(tokens)} tokens")
+    if len(tokens) <= MAX_TRANSCRIPT_TOKENS:
+        return transcript
+    print(f"  [DEBUG] Truncating transcript from {len(tokens)} to {MAX_TRANSCRIPT_TOKENS} tokens")
+    return encoding.decode(tokens[:MAX_TRANSCRIPT_TOKENS]) + "..."
+
+
+def save_script(script_data: dict, path) -> None:
+    """Write a script dict to path as indented JSON (via orjson when installed)."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(script_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(script_data, f, indent=2)
 
 
 def generate_script(title: str, transcript: str = "") -> dict:
@@ -133,13 +235,8 @@ def generate_script(title: str, transcript: str = "") -> dict:
     has_transcript = bool(transcript and transcript.strip())
 
     if has_transcript:
-        print(f"  [DEBUG] Transcript length: {len(transcript)} chars, ~{len(transcript.split())} words")
-
-        # Truncate transcript if too long (keep first 10000 chars)
-        max_chars = 10000
-        if len(transcript) > max_chars:
-            print(f"  [DEBUG] Truncating transcript from {len(transcript)} to {max_chars} chars")
-            transcript = transcript[:max_chars] + "..."
+        # Truncate transcript if too long (keep the first MAX_TRANSCRIPT_TOKENS tokens)
+        transcript = truncate_transcript(transcript)
 
         prompt = f"""Create an engaging YouTube video script based on this content:
 
@@ -158,7 +255,9 @@ Generate a script with scenes, timestamps, narration, and visual suggestions."""
 
 Since no transcript is available, use your creativity to develop an entertaining narrative based on the title theme. Generate a script with scenes, timestamps, narration, and visual suggestions."""
 
-    result = Runner.run_sync(agent, prompt)
+    from agents import Runner
+
+    result = Runner.run_sync(_get_agent(), prompt)
 
     # Parse the raw output, handling the $PARAMETER_NAME wrapper issue
     raw_output = result.final_output
@@ -5,9 +5,14 @@ Usage:
     python3 generate_from_existing_script.py
 """
 
-import json
 import os
 from pathlib import Path
+from dotenv import load_dotenv
+
+# Read .env once, before the pipeline modules read their API keys at import
+load_dotenv()
+
+from genScript.genScript import load_trusted_script
 from voiceOver.genVoice import generate_full_voiceover
 from video_assembler.photo_assembler import generate_photo_video
 
@@ -31,12 +36,13 @@ def main():
         print(f"ERROR: Script file not found: {SCRIPT_PATH}")
         return
 
-    with open(script_path, 'r') as f:
-        script_data = json.load(f)
+    script_data = load_trusted_script(script_path)
+    duration_estimate = script_data.duration_estimate
+    scene_count = len(script_data.scenes)
 
     print(f"  Loaded: {script_path}")
-    print(f"  Duration estimate: {script_data.get('duration_estimate', 'N/A')}s")
-    print(f"  Number of scenes: {len(script_data.get('scenes', []))}")
+    print(f"  Duration estimate: {duration_estimate}s")
+    print(f"  Number of scenes: {scene_count}")
 
     # ========== STEP 2: Generate Voiceover ==========
     print("\n" + "-" * 80)
@@ -102,8 +108,8 @@ def main():
     print("  SUCCESS! VIDEO GENERATION COMPLETE")
     print("=" * 80)
     print(f"\n  Final video: {video_path}")
-    print(f"  Duration: ~{script_data.get('duration_estimate', 'N/A')} seconds")
-    print(f"  Scenes: {len(script_data.get('scenes', []))}")
+    print(f"  Duration: ~{duration_estimate} seconds")
+    print(f"  Scenes: {scene_count}")
     print()
 
 
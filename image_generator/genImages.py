@@ -1,13 +1,244 @@
 """Generate images from script using Stability.AI API."""
 
 import os
+import json
 import base64
+import shutil
 import time
+import hashlib
+import threading
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from dotenv import load_dotenv
-load_dotenv()
+
+# .env is loaded by the entry point; running this file directly makes it one
+if __name__ == "__main__":
+    load_dotenv()
+
+# Scenes rendered at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Stability.AI allows 150 requests per 10 seconds; requests are paced to
+# this budget (with some headroom) instead of sleeping after every call
+RATE_LIMIT_REQUESTS = 140
+RATE_LIMIT_WINDOW = 10.0  # seconds
+
+# Generation settings sent with every request (part of the image cache key)
+CFG_SCALE = 7
+STEPS = 30
+
+# Rendered images are kept here, keyed by prompt and generation settings, so
+# regenerating an unchanged script skips the API. Least recently used files
+# are evicted beyond IMAGE_CACHE_MAX_ENTRIES.
+DEFAULT_IMAGE_CACHE_DIR = "assets/.image_cache"
+IMAGE_CACHE_MAX_ENTRIES = 500
+
+# Written next to the images; records which prompts and settings produced them
+MANIFEST_NAME = ".manifest.json"
+
+# Shared HTTP session so every scene request reuses pooled keep-alive
+# connections instead of paying a new TLS handshake. The pool blocks rather
+# than opening extra throwaway connections, so at most
+# MAX_CONCURRENT_REQUESTS handshakes happen per process. Rate limits (429)
+# and transient 5xx errors are retried by the adapter with exponential
+# backoff, honoring Retry-After.
+_retry = Retry(
+    total=3,
+    backoff_factor=1.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["POST"]),
+    raise_on_status=False,
+    respect_retry_after_header=True,
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_CONCURRENT_REQUESTS,
+    pool_block=True,
+    max_retries=_retry,
+))
+
+
+class _RateLimiter:
+    """Sliding-window limiter: at most max_calls acquire() calls per period seconds."""
+
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call fits in the window, then record it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self.period - (now - self._calls[0])
+            time.sleep(wait)
+
+
+_rate_limiter = _RateLimiter(RATE_LIMIT_REQUESTS, RATE_LIMIT_WINDOW)
+
+
+def _generate_one(
+    i: int,
+    prompt: str,
+    url: str,
+    headers: dict,
+    output_path: Path,
+    width: int,
+    height: int,
+) -> tuple[int, Optional[str]]:
+    """
+    Generate the image for one scene and save it as NN.png.
+
+    Retry backoff only blocks this scene's worker thread, not the other
+    requests in flight.
+
+    Returns:
+        Tuple of (scene index, saved path or None on failure)
+    """
+    # Save with zero-padded numbering (01.png, 02.png, etc.); the body goes
+    # to a temp file first so a failed download never leaves a truncated PNG
+    file_path = output_path / f"{i:02d}.png"
+    tmp_path = file_path.with_suffix(".tmp")
+
+    try:
+        # Only waits when the last RATE_LIMIT_WINDOW seconds used the whole budget;
+        # 429/5xx are retried with backoff by the session
+        _rate_limiter.acquire()
+        response = _SESSION.post(
+            url,
+            headers=headers,
+            json={
+                "text_prompts": [
+                    {
+                        "text": prompt
+                    }
+                ],
+                "cfg_scale": CFG_SCALE,
+                "height": height,
+                "width": width,
+                "samples": 1,
+                "steps": STEPS
+            },
+            stream=True,
+        )
+
+        with response:
+            # Handle API errors
+            if response.status_code != 200:
+                print(f"    ❌ Scene {i}: API Error {response.status_code}: {response.text}")
+                return i, None
+
+            if response.headers.get("Content-Type", "").startswith("application/json"):
+                # Fallback: base64 artifacts in a JSON body
+                data = response.json()
+                for artifact in data["artifacts"]:
+                    img_bytes = base64.b64decode(artifact["base64"])
+
+                    with open(tmp_path, "wb") as f:
+                        f.write(img_bytes)
+            else:
+                # Stream the PNG body straight to disk as it arrives
+                response.raw.decode_content = True
+                with open(tmp_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=65536)
+
+        os.replace(tmp_path, file_path)
+        return i, str(file_path)
+
+    except requests.exceptions.RequestException as e:
+        print(f"    ❌ Scene {i}: Network error: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return i, None
+    except Exception as e:
+        print(f"    ❌ Scene {i}: Error: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return i, None
+
+
+def _link_or_copy(src: str, dst: Path):
+    """Hardlink src to dst, falling back to a copy (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _cache_path(cache_dir: Path, engine_id: str, prompt: str, width: int, height: int) -> Path:
+    """Location of the cached render for this prompt and these settings."""
+    key = hashlib.sha256(
+        f"{engine_id}|{width}x{height}|{CFG_SCALE}|{STEPS}|{prompt}".encode()
+    ).hexdigest()
+    return cache_dir / f"{key}.png"
+
+
+def _evict_image_cache(cache_dir: Path):
+    """Drop least recently used cache entries beyond IMAGE_CACHE_MAX_ENTRIES."""
+    entries = sorted(
+        cache_dir.glob("*.png"),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for stale in entries[IMAGE_CACHE_MAX_ENTRIES:]:
+        stale.unlink(missing_ok=True)
+
+
+def _manifest(scenes: list, width: int, height: int, engine_id: str) -> dict:
+    """Everything that determines the rendered images, for the output-dir manifest."""
+    return {
+        "engine_id": engine_id,
+        "width": width,
+        "height": height,
+        "cfg_scale": CFG_SCALE,
+        "steps": STEPS,
+        "prompts": [scene.get("visual_suggestion", "") for scene in scenes],
+    }
+
+
+def existing_images(
+    script_data: dict,
+    output_dir: str = "assets/photos",
+    width: int = 1344,
+    height: int = 768,
+    engine_id: str = "stable-diffusion-xl-1024-v1-0",
+) -> Optional[List[str]]:
+    """
+    Return the images already in output_dir if they were rendered for exactly this script.
+
+    Returns:
+        List of image paths, or None if any prompt/setting changed or a file is missing
+    """
+    output_path = Path(output_dir)
+    try:
+        manifest = json.loads((output_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    files = manifest.pop("files", None)
+    expected = manifest.get("prompts") or []
+    # A run where some scenes failed must not count as a match, or the
+    # failed scenes would never be retried
+    if not files or len(files) < sum(1 for prompt in expected if prompt):
+        return None
+    if manifest != _manifest(script_data.get("scenes", []), width, height, engine_id):
+        return None
+
+    paths = [output_path / name for name in files]
+    if not all(path.is_file() and path.stat().st_size > 0 for path in paths):
+        return None
+    return [str(path) for path in paths]
 
 
 def generate_images_from_script(
@@ -17,6 +248,8 @@ def generate_images_from_script(
     width: int = 1344,
     height: int = 768,
     engine_id: str = "stable-diffusion-xl-1024-v1-0",
+    cache_dir: str = DEFAULT_IMAGE_CACHE_DIR,
+    concurrency: int = MAX_CONCURRENT_REQUESTS,
 ) -> List[str]:
     """
     Generate images for each scene using Stability.AI.
@@ -28,6 +261,8 @@ def generate_images_from_script(
         width: Image width (default: 1344 for 16:9 ratio)
         height: Image height (default: 768 for 16:9 ratio)
         engine_id: Stability.AI engine to use
+        cache_dir: Where rendered images are cached by prompt and settings
+        concurrency: Scenes rendered at once (at most MAX_CONCURRENT_REQUESTS)
 
     Returns:
         List of paths to generated images
@@ -50,6 +285,12 @@ def generate_images_from_script(
     if not scenes:
         raise ValueError("Script data has no scenes")
 
+    # Same prompts and settings as the images already on disk
+    generated_images = existing_images(script_data, output_dir, width, height, engine_id)
+    if generated_images:
+        print(f"\nAll {len(generated_images)} images are up to date in {output_dir}/, skipping generation")
+        return generated_images
+
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
@@ -60,100 +301,96 @@ def generate_images_from_script(
     print()
 
     api_host = "https://api.stability.ai"
-    generated_images = []
-
-    # Generate image for each scene
-    for i, scene in enumerate(scenes, 1):
-        visual_suggestion = scene.get("visual_suggestion", "")
-
-        if not visual_suggestion:
-            print(f"  Scene {i}/{len(scenes)}: ⚠️  No visual suggestion, skipping")
-            continue
-
-        # Truncate prompt for display
-        prompt_preview = visual_suggestion[:60] + ("..." if len(visual_suggestion) > 60 else "")
-        print(f"  Scene {i}/{len(scenes)}: \"{prompt_preview}\"")
-
-        # Make API request
-        try:
-            response = requests.post(
-                f"{api_host}/v1/generation/{engine_id}/text-to-image",
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                    "Authorization": f"Bearer {api_key}"
-                },
-                json={
-                    "text_prompts": [
-                        {
-                            "text": visual_suggestion
-                        }
-                    ],
-                    "cfg_scale": 7,
-                    "height": height,
-                    "width": width,
-                    "samples": 1,
-                    "steps": 30
-                },
-            )
+    url = f"{api_host}/v1/generation/{engine_id}/text-to-image"
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "image/png",
+        "Authorization": f"Bearer {api_key}"
+    }
+    results = []
+    first_index = {}  # prompt -> scene that renders it
+    duplicates = []  # (scene, scene with the identical prompt)
+    cache_path = Path(cache_dir)
 
-            # Handle API errors
-            if response.status_code != 200:
-                error_msg = f"API Error {response.status_code}: {response.text}"
-                print(f"    ❌ {error_msg}")
-
-                # Check for rate limit
-                if response.status_code == 429:
-                    print("    ⏳ Rate limit hit, waiting 60 seconds...")
-                    time.sleep(60)
-                    # Retry once
-                    response = requests.post(
-                        f"{api_host}/v1/generation/{engine_id}/text-to-image",
-                        headers={
-                            "Content-Type": "application/json",
-                            "Accept": "application/json",
-                            "Authorization": f"Bearer {api_key}"
-                        },
-                        json={
-                            "text_prompts": [{"text": visual_suggestion}],
-                            "cfg_scale": 7,
-                            "height": height,
-                            "width": width,
-                            "samples": 1,
-                            "steps": 30
-                        },
-                    )
-
-                    if response.status_code != 200:
-                        print(f"    ❌ Retry failed: {response.status_code}")
-                        continue
-                else:
-                    continue
-
-            # Parse response and save image
-            data = response.json()
-
-            for artifact in data["artifacts"]:
-                img_bytes = base64.b64decode(artifact["base64"])
-
-                # Save with zero-padded numbering (01.png, 02.png, etc.)
+    # Scenes are independent requests, so they run concurrently
+    # More workers than pooled connections would only queue on pool_block
+    workers = max(1, min(concurrency, MAX_CONCURRENT_REQUESTS))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for i, scene in enumerate(scenes, 1):
+            visual_suggestion = scene.get("visual_suggestion", "")
+
+            if not visual_suggestion:
+                print(f"  Scene {i}/{len(scenes)}: ⚠️  No visual suggestion, skipping")
+                continue
+
+            # Identical prompts are rendered once and linked afterwards
+            if visual_suggestion in first_index:
+                print(f"  Scene {i}/{len(scenes)}: Same prompt as scene {first_index[visual_suggestion]}, reusing")
+                duplicates.append((i, first_index[visual_suggestion]))
+                continue
+            first_index[visual_suggestion] = i
+
+            # Truncate prompt for display
+            prompt_preview = visual_suggestion[:60] + ("..." if len(visual_suggestion) > 60 else "")
+
+            # Rendered by an earlier run with the same settings
+            cached = _cache_path(cache_path, engine_id, visual_suggestion, width, height)
+            if cached.exists():
+                print(f"  Scene {i}/{len(scenes)}: \"{prompt_preview}\" (cached)")
                 file_path = output_path / f"{i:02d}.png"
+                shutil.copyfile(cached, file_path)
+                os.utime(cached)  # Mark as recently used
+                results.append((i, str(file_path)))
+                continue
 
-                with open(file_path, "wb") as f:
-                    f.write(img_bytes)
+            print(f"  Scene {i}/{len(scenes)}: \"{prompt_preview}\"")
 
-                generated_images.append(str(file_path))
+            future = pool.submit(
+                _generate_one, i, visual_suggestion, url, headers, output_path, width, height
+            )
+            futures[future] = cached
+
+        # Report progress as images finish
+        for future in as_completed(futures):
+            i, file_path = future.result()
+            if file_path:
+                results.append((i, file_path))
                 print(f"    ✓ Saved → {file_path}")
 
-        except requests.exceptions.RequestException as e:
-            print(f"    ❌ Network error: {e}")
-            continue
-        except Exception as e:
-            print(f"    ❌ Error: {e}")
-            continue
+                # Store via a temp file so an interrupted copy never looks like a hit
+                cached = futures[future]
+                cache_path.mkdir(parents=True, exist_ok=True)
+                tmp = cached.with_suffix(".tmp")
+                shutil.copyfile(file_path, tmp)
+                os.replace(tmp, cached)
+
+    if futures:
+        _evict_image_cache(cache_path)
+
+    rendered = dict(results)
+    for i, source_index in duplicates:
+        source = rendered.get(source_index)
+        if source:
+            file_path = output_path / f"{i:02d}.png"
+            file_path.unlink(missing_ok=True)
+            _link_or_copy(source, file_path)
+            results.append((i, str(file_path)))
+
+    # Restore scene order (01.png, 02.png, ...)
+    generated_images = [file_path for _, file_path in sorted(results)]
 
-        # Small delay to avoid overwhelming the API
-        time.sleep(0.5)
+    # Record what produced these files so an unchanged rerun can skip them;
+    # only a complete set is recorded, so failed scenes are retried next run
+    expected = sum(1 for scene in scenes if scene.get("visual_suggestion", ""))
+    if not generated_images or len(generated_images) < expected:
+        (output_path / MANIFEST_NAME).unlink(missing_ok=True)
+    else:
+        manifest = _manifest(scenes, width, height, engine_id)
+        manifest["files"] = [Path(file_path).name for file_path in generated_images]
+        tmp = output_path / f"{MANIFEST_NAME}.tmp"
+        tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp, output_path / MANIFEST_NAME)
 
     print(f"\n✅ Generated {len(generated_images)}/{len(scenes)} images successfully")
 
@@ -1,3 +1,8 @@
+from dotenv import load_dotenv
+
+# Read .env once, before youtube_research reads its API key at import
+load_dotenv()
+
 import youtube_research
 import pandas as pd
 
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 """Regenerate video from existing script, voiceover, and images."""
 
-import json
 from pathlib import Path
 
+from dotenv import load_dotenv
+
+# Read .env once, before the pipeline modules read their API keys at import
+load_dotenv()
+
+from genScript.genScript import load_trusted_script
 from video_assembler.photo_assembler import generate_photo_video
 
 
@@ -26,8 +31,7 @@ def main():
 
     # Load script data
     print(f"Loading script: {script_path}")
-    with open(script_path) as f:
-        script_data = json.load(f)
+    script_data = load_trusted_script(script_path)
 
     print(f"Voiceover: {voiceover_path}")
     print(f"Photos directory: {photos_dir}")
@@ -14,34 +14,95 @@ Usage:
     python run_pipeline.py
     python run_pipeline.py --channel "Channel Name"
     python run_pipeline.py --channel "Channel Name" --auto-select 1
+    python run_pipeline.py --channel "Channel A,Channel B"
 """
 
 import os
 import re
-import json
+import shutil
+import logging
 import argparse
+import threading
 from datetime import datetime
 from pathlib import Path
-from youtube_transcript_api._errors import (
-    TranscriptsDisabled,
-    VideoUnavailable,
-    NoTranscriptFound,
-)
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from dotenv import load_dotenv
 
-# Import pipeline components
-from youtube_research import start as research_channel
-from video_content.getContent import get_transcript
-from genScript.genScript import generate_script
-from voiceOver.genVoice import generate_full_voiceover
-from video_assembler.photo_assembler import generate_photo_video
+# Read .env once, before the pipeline modules read their API keys at import
+load_dotenv()
+
+# Pipeline components (pandas, LiteLLM, ElevenLabs, MoviePy, ...) are
+# imported inside the run_pipeline_* functions, so --help and argument
+# errors don't pay for them
+
+# Failures are reported with a one-line print; full tracebacks are logged
+# at DEBUG and only shown with --verbose
+logger = logging.getLogger(__name__)
+
+# API keys the pipeline cannot run without
+REQUIRED_VARS = frozenset(("YOUTUBE_API_KEY", "GEMINI_API_KEY", "ELEVEN_LABS_API", "STABILITY_API_KEY"))
+
+
+# Standard watch URL (v=), short URL (youtu.be/) or embed URL (embed/)
+_VIDEO_ID_RE = re.compile(r'(?:v=|youtu\.be/|embed/)([^?&]+)')
+
+
+# Deletes every ASCII character that isn't a word character, whitespace or '-'
+_SLUG_TABLE = str.maketrans({
+    c: None for c in map(chr, range(128))
+    if not (c.isalnum() or c.isspace() or c in "_-")
+})
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_JOIN = re.compile(r'[-\s]+')
 
 
 def slugify(text: str) -> str:
     """Convert text to a filename-safe slug."""
     text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '_', text)
-    return text[:50]
+    # translate() handles the common ASCII title in one pass; the regex is
+    # only needed for non-ASCII punctuation (curly quotes, emoji, ...)
+    text = text.translate(_SLUG_TABLE) if text.isascii() else _SLUG_STRIP.sub('', text)
+    return _SLUG_JOIN.sub('_', text)[:50]
+
+
+def _reset_photos_dir(photos_dir_path: Path) -> None:
+    """
+    Remove everything in the photos directory in one tree walk and recreate it empty.
+
+    Errors (e.g. a locked or read-only file) propagate, so stale photos are
+    never mixed into the new slideshow.
+    """
+    if photos_dir_path.exists():
+        print("  Clearing old photos...")
+        shutil.rmtree(photos_dir_path)
+    photos_dir_path.mkdir(parents=True, exist_ok=True)
+
+
+def _run_in_background(fn, *args) -> Future:
+    """
+    Start fn(*args) on its own worker thread and return its future.
+
+    Pool threads are joined at interpreter exit, so a started job still
+    finishes if the pipeline returns early.
+    """
+    pool = ThreadPoolExecutor(max_workers=1)
+    future = pool.submit(fn, *args)
+    pool.shutdown(wait=False)
+    return future
+
+
+def _discard_voiceover(voice_future: Future, voice_cancel: threading.Event, voiceover_path: str) -> None:
+    """Stop a background voiceover the pipeline no longer needs and remove its file."""
+    voice_cancel.set()
+    if not voice_future.cancel():
+        # Already running: scenes not yet requested are skipped, so this
+        # only waits for the requests in flight
+        print("  Cancelling voiceover generation...")
+        try:
+            voice_future.result()
+        except Exception:
+            pass
+    Path(voiceover_path).unlink(missing_ok=True)
 
 
 def extract_video_id(video_link: str) -> str:
@@ -49,18 +110,8 @@ def extract_video_id(video_link: str) -> str:
     if not video_link:
         return None
 
-    patterns = [
-        r'v=([^&]+)',           # Standard watch URL
-        r'youtu\.be/([^?]+)',   # Short URL
-        r'embed/([^?]+)',       # Embed URL
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, str(video_link))
-        if match:
-            return match.group(1)
-
-    return None
+    match = _VIDEO_ID_RE.search(str(video_link))
+    return match.group(1) if match else None
 
 
 def display_videos(df):
@@ -69,16 +120,18 @@ def display_videos(df):
     print("  TOP VIRAL VIDEOS")
     print("=" * 80)
 
-    # Sort by virality and take top 10
-    df_sorted = df.sort_values("Virality Score", ascending=False).head(10)
+    # Top 10 by virality; a partial selection, the rest is never sorted
+    df_sorted = df.nlargest(10, "Virality Score")
 
     print(f"\n{'#':<3} {'Title':<45} {'Views':<12} {'Virality':<10}")
     print("-" * 80)
 
-    for i, (_, row) in enumerate(df_sorted.iterrows(), 1):
-        title = row['Title'][:42] + "..." if len(row['Title']) > 45 else row['Title']
-        views = f"{row['View Count']:,}"
-        virality = f"{row['Virality Score']:,.0f}"
+    # Plain tuples per row; iterrows() would build a Series for each one
+    rows = df_sorted[["Title", "View Count", "Virality Score"]].itertuples(index=False, name=None)
+    for i, (title, view_count, virality_score) in enumerate(rows, 1):
+        title = title[:42] + "..." if len(title) > 45 else title
+        views = f"{view_count:,}"
+        virality = f"{virality_score:,.0f}"
         print(f"{i:<3} {title:<45} {views:<12} {virality:<10}")
 
     print("-" * 80)
@@ -108,6 +161,7 @@ def select_video(df_sorted):
 def run_pipeline_direct(
     title: str,
     output_dir: str = "output/pipeline",
+    use_cache: bool = True,
 ) -> str:
     """
     Run direct pipeline: Generate video from title only (no transcript).
@@ -115,19 +169,24 @@ def run_pipeline_direct(
     Args:
         title: Video title
         output_dir: Directory for all output files
+        use_cache: Reuse a previously generated script for the same inputs
 
     Returns:
         Path to the generated video
     """
+    # Import pipeline components
+    from genScript.genScript import save_script
+    from genScript.cache import cached_generate_script as generate_script
+    from voiceOver.genVoice import generate_full_voiceover
+    from video_assembler.photo_assembler import generate_photo_video
+
     print("=" * 60)
     print("  DIRECT MODE: TITLE-ONLY GENERATION")
     print("=" * 60)
 
     # Create output directories
-    os.makedirs(output_dir, exist_ok=True)
-    os.makedirs(f"{output_dir}/scripts", exist_ok=True)
-    os.makedirs(f"{output_dir}/voiceovers", exist_ok=True)
-    os.makedirs(f"{output_dir}/videos", exist_ok=True)
+    for subdir in ("scripts", "voiceovers", "videos"):
+        os.makedirs(f"{output_dir}/{subdir}", exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     slug = slugify(title)
@@ -140,65 +199,69 @@ def run_pipeline_direct(
     print("Mode: No transcript (title-only generation)")
 
     try:
-        script_data = generate_script(title, "")  # Empty transcript
+        script_data = generate_script(title, "", force=not use_cache)  # Empty transcript
         script_path = f"{output_dir}/scripts/{slug}_{timestamp}.json"
 
-        # Save script to file
-        with open(script_path, "w") as f:
-            json.dump(script_data, f, indent=2)
+        # Save script to file in the background; later stages use the
+        # in-memory dict
+        save_future = _run_in_background(save_script, script_data, script_path)
 
         print(f"  Script generated!")
         print(f"  - Duration estimate: {script_data.get('duration_estimate', 'N/A')}s")
         print(f"  - Number of scenes: {len(script_data.get('scenes', []))}")
-        print(f"  - Saved to: {script_path}")
 
     except Exception as e:
         print(f"  Script generation failed: {e}")
         raise
 
+    # The voiceover only needs the script, so it is synthesized in the
+    # background while the images generate
+    voiceover_path = f"{output_dir}/voiceovers/{slug}_{timestamp}.mp3"
+    voice_cancel = threading.Event()
+    voice_future = _run_in_background(generate_full_voiceover, script_data, voiceover_path, voice_cancel)
+
     # ========== STEP 2: Auto-Generate Images using Stability.AI ==========
     print("\n" + "-" * 60)
     print("STEP 2: Generating Images (Stability.AI)")
     print("-" * 60)
 
-    from image_generator.genImages import generate_images_from_script
+    from image_generator.genImages import generate_images_from_script, existing_images
 
     try:
-        # Clear old photos
-        photos_dir_path = Path("assets/photos")
-        if photos_dir_path.exists():
-            print("  Clearing old photos...")
-            for file in photos_dir_path.glob("*"):
-                if file.is_file():
-                    file.unlink()
-
-        # Generate new images from visual suggestions
-        generated_images = generate_images_from_script(
-            script_data=script_data,
-            output_dir="assets/photos",
-        )
+        # Images rendered for this exact script are reused as they are
+        generated_images = existing_images(script_data, "assets/photos")
+
+        if generated_images is None:
+            # Clear old photos
+            _reset_photos_dir(Path("assets/photos"))
+
+            # Generate new images from visual suggestions
+            generated_images = generate_images_from_script(
+                script_data=script_data,
+                output_dir="assets/photos",
+            )
+        else:
+            print("  Images cache hit: assets/photos already matches this script")
 
         print(f"\n✓ Generated {len(generated_images)} images successfully")
         print(f"  Saved to: {os.path.abspath('assets/photos/')}")
 
     except Exception as e:
         print(f"\n✗ Image generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Image generation failed", exc_info=True)
         print("\nCannot continue without images. Exiting pipeline.")
+        _discard_voiceover(voice_future, voice_cancel, voiceover_path)
         return None
 
-    print("✓ Continuing to voiceover generation...")
+    print("✓ Waiting for voiceover generation...")
 
     # ========== STEP 3: Generate Voiceover ==========
     print("\n" + "-" * 60)
     print("STEP 3: Generating Voiceover")
     print("-" * 60)
 
-    voiceover_path = f"{output_dir}/voiceovers/{slug}_{timestamp}.mp3"
-
     try:
-        result = generate_full_voiceover(script_data, voiceover_path)
+        result = voice_future.result()
 
         if result:
             print(f"  Voiceover generated!")
@@ -238,6 +301,15 @@ def run_pipeline_direct(
         print(f"  Video generation failed: {e}")
         raise
 
+    # The script save ran in the background; report it only once it landed
+    try:
+        save_future.result()
+        print(f"\n  Script saved to: {script_path}")
+    except Exception as e:
+        print(f"\n  Script save failed: {e}")
+        logger.debug("Script save failed", exc_info=True)
+        script_path = "(not saved)"
+
     # ========== SUMMARY ==========
     print("\n" + "=" * 60)
     print("  PIPELINE COMPLETE!")
@@ -256,27 +328,41 @@ def run_pipeline_research(
     channel_name: str,
     output_dir: str = "output/pipeline",
     auto_select: int = None,
+    use_cache: bool = True,
 ):
     """
     Run research pipeline: Channel research with optional transcript.
 
     Args:
-        channel_name: YouTube channel name to research
+        channel_name: YouTube channel name to research; several names may be
+            given comma-separated, and their videos are ranked together
         output_dir: Directory for all output files
         auto_select: Auto-select video by index (1-10) for non-interactive mode
+        use_cache: Reuse a previously generated script for the same inputs
 
     Returns:
         Path to the generated video
     """
+    # Import pipeline components
+    from youtube_transcript_api._errors import (
+        TranscriptsDisabled,
+        VideoUnavailable,
+        NoTranscriptFound,
+    )
+    from youtube_research import cached_start as research_channel
+    from video_content.getContent import cached_transcript as get_transcript
+    from genScript.genScript import save_script
+    from genScript.cache import cached_generate_script as generate_script
+    from voiceOver.genVoice import generate_full_voiceover
+    from video_assembler.photo_assembler import generate_photo_video
+
     print("=" * 60)
     print("  RESEARCH MODE: CHANNEL RESEARCH + OPTIONAL TRANSCRIPT")
     print("=" * 60)
 
     # Create output directories
-    os.makedirs(output_dir, exist_ok=True)
-    os.makedirs(f"{output_dir}/scripts", exist_ok=True)
-    os.makedirs(f"{output_dir}/voiceovers", exist_ok=True)
-    os.makedirs(f"{output_dir}/videos", exist_ok=True)
+    for subdir in ("scripts", "voiceovers", "videos"):
+        os.makedirs(f"{output_dir}/{subdir}", exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -284,10 +370,20 @@ def run_pipeline_research(
     print("\n" + "-" * 60)
     print("STEP 1: Researching Channel")
     print("-" * 60)
-    print(f"Channel: {channel_name}")
+    channels = [name.strip() for name in channel_name.split(",") if name.strip()]
+    print(f"Channel: {', '.join(channels)}")
 
     try:
-        df = research_channel(channel_name)
+        if len(channels) > 1:
+            # Each channel is independent API + pandas work; separate
+            # processes keep them off one GIL and give each its own client
+            import pandas as pd
+
+            with ProcessPoolExecutor(max_workers=min(4, len(channels))) as pool:
+                dfs = list(pool.map(research_channel, channels))
+            df = pd.concat(dfs, ignore_index=True)
+        else:
+            df = research_channel(channels[0])
 
         if df is None or df.empty:
             print("  No videos found for this channel")
@@ -449,52 +545,58 @@ def run_pipeline_research(
     slug = slugify(video_title)
 
     try:
-        script_data = generate_script(video_title, transcript)
+        script_data = generate_script(video_title, transcript, force=not use_cache)
         script_path = f"{output_dir}/scripts/{slug}_{timestamp}.json"
 
-        # Save script to file
-        with open(script_path, "w") as f:
-            json.dump(script_data, f, indent=2)
+        # Save script to file in the background; later stages use the
+        # in-memory dict
+        save_future = _run_in_background(save_script, script_data, script_path)
 
         print(f"  Script generated!")
         print(f"  - Duration estimate: {script_data.get('duration_estimate', 'N/A')}s")
         print(f"  - Number of scenes: {len(script_data.get('scenes', []))}")
-        print(f"  - Saved to: {script_path}")
 
     except Exception as e:
         print(f"  Script generation failed: {e}")
         raise
 
+    # The voiceover only needs the script, so it is synthesized in the
+    # background while the images generate
+    voiceover_path = f"{output_dir}/voiceovers/{slug}_{timestamp}.mp3"
+    voice_cancel = threading.Event()
+    voice_future = _run_in_background(generate_full_voiceover, script_data, voiceover_path, voice_cancel)
+
     # ========== STEP 5: Auto-Generate Images using Stability.AI ==========
     print("\n" + "-" * 60)
     print("STEP 5: Generating Images (Stability.AI)")
     print("-" * 60)
 
-    from image_generator.genImages import generate_images_from_script
+    from image_generator.genImages import generate_images_from_script, existing_images
 
     try:
-        # Clear old photos
-        photos_dir_path = Path("assets/photos")
-        if photos_dir_path.exists():
-            print("  Clearing old photos...")
-            for file in photos_dir_path.glob("*"):
-                if file.is_file():
-                    file.unlink()
-
-        # Generate new images from visual suggestions
-        generated_images = generate_images_from_script(
-            script_data=script_data,
-            output_dir="assets/photos",
-        )
+        # Images rendered for this exact script are reused as they are
+        generated_images = existing_images(script_data, "assets/photos")
+
+        if generated_images is None:
+            # Clear old photos
+            _reset_photos_dir(Path("assets/photos"))
+
+            # Generate new images from visual suggestions
+            generated_images = generate_images_from_script(
+                script_data=script_data,
+                output_dir="assets/photos",
+            )
+        else:
+            print("  Images cache hit: assets/photos already matches this script")
 
         print(f"\n✓ Generated {len(generated_images)} images successfully")
         print(f"  Saved to: {os.path.abspath('assets/photos/')}")
 
     except Exception as e:
         print(f"\n✗ Image generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Image generation failed", exc_info=True)
         print("\nCannot continue without images. Exiting pipeline.")
+        _discard_voiceover(voice_future, voice_cancel, voiceover_path)
         return None
 
     # ========== STEP 6: Generate Voiceover ==========
@@ -502,10 +604,8 @@ def run_pipeline_research(
     print("STEP 6: Generating Voiceover")
     print("-" * 60)
 
-    voiceover_path = f"{output_dir}/voiceovers/{slug}_{timestamp}.mp3"
-
     try:
-        result = generate_full_voiceover(script_data, voiceover_path)
+        result = voice_future.result()
 
         if result:
             print(f"  Voiceover generated!")
@@ -545,6 +645,15 @@ def run_pipeline_research(
         print(f"  Video generation failed: {e}")
         raise
 
+    # The script save ran in the background; report it only once it landed
+    try:
+        save_future.result()
+        print(f"\n  Script saved to: {script_path}")
+    except Exception as e:
+        print(f"\n  Script save failed: {e}")
+        logger.debug("Script save failed", exc_info=True)
+        script_path = "(not saved)"
+
     # ========== SUMMARY ==========
     print("\n" + "=" * 60)
     print("  PIPELINE COMPLETE!")
@@ -580,7 +689,7 @@ def main():
         "--channel",
         type=str,
         default=None,
-        help="YouTube channel name (for research mode)"
+        help="YouTube channel name, or comma-separated names (for research mode)"
     )
     parser.add_argument(
         "--auto-select",
@@ -594,12 +703,26 @@ def main():
         default="output/pipeline",
         help="Output directory (default: output/pipeline)"
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print full tracebacks when a step fails"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Generate a fresh script even if one was cached for this title"
+    )
 
     args = parser.parse_args()
 
+    # Only this module goes to DEBUG; library debug output stays hidden
+    logging.basicConfig(format="%(levelname)s %(name)s: %(message)s")
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
     # Check for required environment variables
-    required_vars = ["YOUTUBE_API_KEY", "GEMINI_API_KEY", "ELEVEN_LABS_API", "STABILITY_API_KEY"]
-    missing_vars = [var for var in required_vars if not os.environ.get(var)]
+    env = os.environ
+    missing_vars = sorted(var for var in REQUIRED_VARS if not env.get(var))
 
     if missing_vars:
         print("ERROR: Missing required environment variables:")
@@ -645,6 +768,7 @@ def main():
             video_path = run_pipeline_direct(
                 title=title,
                 output_dir=args.output_dir,
+                use_cache=not args.no_cache,
             )
 
             if video_path:
@@ -652,8 +776,7 @@ def main():
 
         except Exception as e:
             print(f"\nPipeline failed with error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("Pipeline failed", exc_info=True)
 
     elif mode == "research":
         # Research mode: Existing flow with optional transcript
@@ -670,6 +793,7 @@ def main():
                 channel_name=channel_name,
                 output_dir=args.output_dir,
                 auto_select=args.auto_select,
+                use_cache=not args.no_cache,
             )
 
             if video_path:
@@ -677,8 +801,7 @@ def main():
 
         except Exception as e:
             print(f"\nPipeline failed with error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("Pipeline failed", exc_info=True)
 
 
 if __name__ == "__main__":
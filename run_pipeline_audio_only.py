@@ -19,31 +19,33 @@ Usage:
 
 import os
 import re
-import json
 import argparse
 from datetime import datetime
 from pathlib import Path
-from youtube_transcript_api._errors import (
-    TranscriptsDisabled,
-    VideoUnavailable,
-    NoTranscriptFound,
+from dotenv import load_dotenv
+
+# Read .env once, before the pipeline modules read their API keys at import
+load_dotenv()
+
+# Pipeline components (pandas, LiteLLM, ElevenLabs, ...) are imported
+# inside the run_pipeline_* functions, so --help and argument errors
+# don't pay for them
+
+# Compiled once at import instead of on every call
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_JOIN = re.compile(r'[-\s]+')
+_VIDEO_ID_PATTERNS = (
+    re.compile(r'(?:v=|\/)([0-9A-Za-z_-]{11}).*'),
+    re.compile(r'(?:embed\/)([0-9A-Za-z_-]{11})'),
+    re.compile(r'^([0-9A-Za-z_-]{11})$'),
 )
 
-# Import pipeline components
-from youtube_research import start as research_channel
-from video_content.getContent import get_transcript
-from genScript.genScript import generate_script
-from voiceOver.genVoice import generate_full_voiceover
-
-# Import MoviePy for blank video generation
-from moviepy import ColorClip, AudioFileClip
-
 
 def slugify(text: str) -> str:
     """Convert text to a filename-safe slug."""
     text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '_', text)
+    text = _SLUG_STRIP.sub('', text)
+    text = _SLUG_JOIN.sub('_', text)
     return text[:50]
 
 
@@ -52,81 +54,14 @@ def extract_video_id(video_link: str) -> str:
     if not video_link:
         return None
 
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'(?:embed\/)([0-9A-Za-z_-]{11})',
-        r'^([0-9A-Za-z_-]{11})$',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, video_link)
+    for pattern in _VIDEO_ID_PATTERNS:
+        match = pattern.search(video_link)
         if match:
             return match.group(1)
 
     return None
 
 
-def generate_blank_video(
-    voiceover_path: str,
-    output_path: str,
-    resolution: tuple = (1920, 1080),
-    background_color: tuple = (0, 0, 0),
-) -> str:
-    """Generate a video with blank background and voiceover audio.
-
-    Args:
-        voiceover_path: Path to voiceover MP3 file
-        output_path: Where to save the output video
-        resolution: Video resolution (default: 1920x1080)
-        background_color: RGB color tuple (default: black)
-
-    Returns:
-        Path to the generated video file
-    """
-    print("Generating blank background video...")
-    print(f"  Voiceover: {voiceover_path}")
-    print(f"  Output: {output_path}")
-    print(f"  Resolution: {resolution[0]}x{resolution[1]}")
-
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-    # Load audio to get duration
-    audio = AudioFileClip(voiceover_path)
-    duration = audio.duration
-    print(f"  Duration: {duration:.1f}s")
-
-    # Create blank video clip
-    video = ColorClip(
-        size=resolution,
-        color=background_color,
-        duration=duration,
-    )
-
-    # Attach audio
-    video = video.with_audio(audio)
-    video = video.with_fps(30)
-
-    # Render video
-    print("Rendering video...")
-    video.write_videofile(
-        output_path,
-        fps=30,
-        codec="libx264",
-        audio_codec="aac",
-        bitrate="5000k",
-        audio_bitrate="192k",
-        threads=4,
-    )
-
-    # Cleanup
-    video.close()
-    audio.close()
-
-    print(f"Done! Video saved to: {output_path}")
-    return output_path
-
-
 def run_pipeline_direct(title: str, output_dir: str = "output/pipeline") -> str:
     """Run pipeline in direct mode (title only, no transcript).
 
@@ -137,6 +72,11 @@ def run_pipeline_direct(title: str, output_dir: str = "output/pipeline") -> str:
     Returns:
         Path to generated video file, or None if failed
     """
+    # Import pipeline components
+    from genScript.genScript import generate_script, save_script
+    from voiceOver.genVoice import generate_full_voiceover
+    from assemble_video_blank import generate_blank_video
+
     print("\n" + "=" * 60)
     print("  DIRECT MODE - AUDIO ONLY PIPELINE")
     print("=" * 60)
@@ -173,8 +113,7 @@ def run_pipeline_direct(title: str, output_dir: str = "output/pipeline") -> str:
 
     # Save script to JSON
     script_path = script_dir / f"{base_filename}.json"
-    with open(script_path, "w") as f:
-        json.dump(script_data, f, indent=2)
+    save_script(script_data, script_path)
     print(f"  ✓ Script saved: {script_path}")
 
     # Step 2: Generate voiceover
@@ -226,6 +165,18 @@ def run_pipeline_research(
     Returns:
         Path to generated video file, or None if failed
     """
+    # Import pipeline components
+    from youtube_transcript_api._errors import (
+        TranscriptsDisabled,
+        VideoUnavailable,
+        NoTranscriptFound,
+    )
+    from youtube_research import start as research_channel
+    from video_content.getContent import get_transcript
+    from genScript.genScript import generate_script, save_script
+    from voiceOver.genVoice import generate_full_voiceover
+    from assemble_video_blank import generate_blank_video
+
     print("\n" + "=" * 60)
     print("  RESEARCH MODE - AUDIO ONLY PIPELINE")
     print("=" * 60)
@@ -390,8 +341,7 @@ def run_pipeline_research(
 
     # Save script to JSON
     script_path = script_dir / f"{base_filename}.json"
-    with open(script_path, "w") as f:
-        json.dump(script_data, f, indent=2)
+    save_script(script_data, script_path)
     print(f"  ✓ Script saved: {script_path}")
 
     # Step 5: Generate voiceover
@@ -1,10 +1,14 @@
 """Asset manager for managing local video clips."""
 
+import os
+import json
 import random
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 
 from .config import DEFAULT_CONFIG
+from .ffmpeg_utils import probe_media
 
 
 class AssetManager:
@@ -23,6 +27,8 @@ class AssetManager:
         self.assets_dir = Path(assets_dir or DEFAULT_CONFIG.get("assets_dir", "./assets/videos"))
         self.assets_dir.mkdir(parents=True, exist_ok=True)
         self._used_videos = set()  # Track used videos to avoid repetition
+        # Probed duration/size per video file, reused while the file is unchanged
+        self.index_path = self.assets_dir / ".index.json"
 
     def get_available_videos(self) -> List[Path]:
         """
@@ -37,6 +43,72 @@ class AssetManager:
             videos.extend(self.assets_dir.glob(f"*{ext.upper()}"))
         return sorted(videos)
 
+    def _load_index(self) -> dict:
+        """Read the metadata index, or start empty if it is missing or unreadable."""
+        try:
+            return json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_index(self, index: dict):
+        """Write the metadata index atomically."""
+        tmp_path = self.index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+
+    def get_video_metadata(self, videos: List[Path]) -> dict:
+        """
+        Get duration and frame size for video files, probing only new or changed ones.
+
+        Entries in assets_dir/.index.json are keyed by file name and reused
+        while the file's mtime and size match.
+
+        Args:
+            videos: Video files inside assets_dir
+
+        Returns:
+            Dict of path string -> (duration, (width, height))
+        """
+        index = self._load_index()
+        metadata = {}
+        changed = False
+
+        stale_paths = []
+        for path in videos:
+            stat = path.stat()
+            entry = index.get(path.name)
+            if not entry or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+                stale_paths.append((path, stat))
+
+        # ffprobe runs as a subprocess, so threads probe new files in parallel
+        if stale_paths:
+            with ThreadPoolExecutor(max_workers=min(16, len(stale_paths))) as pool:
+                probed = pool.map(lambda item: probe_media(item[0]), stale_paths)
+                for (path, stat), (duration, (width, height)) in zip(stale_paths, probed):
+                    index[path.name] = {
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "duration": duration,
+                        "width": width,
+                        "height": height,
+                    }
+            changed = True
+
+        for path in videos:
+            entry = index[path.name]
+            metadata[str(path)] = (entry["duration"], (entry["width"], entry["height"]))
+
+        # Forget files that were removed from the folder
+        names = {path.name for path in videos}
+        for stale in set(index) - names:
+            del index[stale]
+            changed = True
+
+        if changed:
+            self._save_index(index)
+
+        return metadata
+
     def get_random_video(self) -> str:
         """
         Get a random video from available assets.
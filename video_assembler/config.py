@@ -1,5 +1,7 @@
 """Configuration settings for the video assembler."""
 
+import functools
+import subprocess
 from pathlib import Path
 
 # Base directory for the video assembler
@@ -24,6 +26,54 @@ DEFAULT_CONFIG = {
 }
 
 
+# Hardware H.264 encoders to try, in order, with their tuning options.
+# DEFAULT_CONFIG["video_codec"] is used when none of them works here.
+HW_ENCODERS = [
+    ("h264_nvenc", ["-preset", "p4", "-rc", "vbr", "-cq", "23"]),  # NVIDIA
+    ("h264_amf", ["-quality", "speed"]),  # AMD
+    ("h264_videotoolbox", []),  # macOS
+    ("h264_qsv", ["-preset", "veryfast"]),  # Intel Quick Sync
+]
+
+
+@functools.lru_cache(maxsize=None)
+def pick_video_encoder() -> tuple[str, tuple[str, ...]]:
+    """
+    Pick a hardware H.264 encoder if this machine has one, else the default codec.
+
+    ffmpeg lists encoders it was built with even when the GPU is missing,
+    so each candidate must also pass a one-frame test encode. Runs once
+    per process.
+
+    Returns:
+        Tuple of (codec name, extra ffmpeg output options)
+    """
+    try:
+        built_in = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+        ).stdout
+    except OSError:
+        built_in = ""
+
+    for codec, options in HW_ENCODERS:
+        if codec not in built_in:
+            continue
+        probe = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                "-frames:v", "1", "-c:v", codec, "-f", "null", "-",
+            ],
+            capture_output=True,
+        )
+        if probe.returncode == 0:
+            return codec, tuple(options)
+
+    return DEFAULT_CONFIG["video_codec"], ()
+
+
 def get_config(key: str, default=None):
     """Get a configuration value."""
     return DEFAULT_CONFIG.get(key, default)
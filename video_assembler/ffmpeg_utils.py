@@ -0,0 +1,52 @@
+"""Helpers for running the ffmpeg command-line tools."""
+
+import subprocess
+
+
+def run_ffmpeg(args: list[str]):
+    """
+    Run ffmpeg with the given arguments.
+
+    Args:
+        args: Arguments after the executable (inputs, filters, output)
+
+    Raises:
+        RuntimeError: If ffmpeg exits with an error
+    """
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", *args]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {result.stderr.strip()[-2000:]}")
+
+
+def probe_media(path: str) -> tuple[float, tuple[int, int]]:
+    """
+    Read duration and frame size from the container headers with ffprobe.
+
+    Nothing is decoded. Audio-only files report a (0, 0) frame size.
+
+    Returns:
+        Tuple of (duration in seconds, (width, height))
+
+    Raises:
+        RuntimeError: If ffprobe cannot read the file
+    """
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "format=duration:stream=width,height",
+            "-of", "default=noprint_wrappers=1",
+            str(path),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe failed for {path}: {result.stderr.strip()}")
+
+    fields = dict(line.split("=", 1) for line in result.stdout.splitlines() if "=" in line)
+    return (
+        float(fields["duration"]),
+        (int(fields.get("width", 0)), int(fields.get("height", 0))),
+    )
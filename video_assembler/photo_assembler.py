@@ -1,14 +1,17 @@
 """Photo slideshow video assembler with Ken Burns panning effects."""
 
+import gc
 import os
 import random
 from pathlib import Path
 
+import numpy as np
+from PIL import Image
 from moviepy import (
     ImageClip,
     AudioFileClip,
     concatenate_videoclips,
-    ColorClip,
+    VideoClip,
     CompositeVideoClip,
 )
 from moviepy.video.fx import FadeIn, FadeOut
@@ -19,6 +22,9 @@ from .config import DEFAULT_CONFIG, ensure_directories
 RESOLUTION = (1920, 1080)
 PHOTO_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp', '.bmp']
 
+# One black frame shared by every background and fallback clip
+_BLACK = np.zeros((RESOLUTION[1], RESOLUTION[0], 3), dtype=np.uint8)
+
 # Ken Burns effect settings
 ZOOM_RATIO = 1.15  # How much larger than frame (15% zoom margin)
 
@@ -33,6 +39,11 @@ EFFECTS = [
 ]
 
 
+def black_clip(duration: float) -> VideoClip:
+    """Black RESOLUTION clip that returns the shared _BLACK frame instead of allocating one."""
+    return VideoClip(frame_function=lambda t: _BLACK, duration=duration).with_fps(30)
+
+
 def resize_cover(clip, target_w: int, target_h: int):
     """
     Resize image to cover target dimensions (like CSS object-fit: cover).
@@ -59,6 +70,12 @@ def get_photos(photos_dir: str) -> list[Path]:
     return sorted(photos)
 
 
+def load_photo(photo_path: Path) -> np.ndarray:
+    """Decode a photo into an RGB frame array."""
+    with Image.open(photo_path) as img:
+        return np.asarray(img.convert("RGB"))
+
+
 def apply_ken_burns(clip: ImageClip, effect: str, duration: float) -> ImageClip:
     """
     Apply Ken Burns panning/zoom effect to an image clip.
@@ -159,7 +176,7 @@ def generate_photo_video(
     Generate a video from photos with Ken Burns effects.
 
     Args:
-        script_data: Script JSON with scenes
+        script_data: Script JSON (or ScriptOutput) with scenes
         voiceover_path: Path to voiceover audio file
         output_path: Where to save final video
         photos_dir: Directory containing photos (default: assets/photos)
@@ -184,7 +201,7 @@ def generate_photo_video(
     print(f"Duration: {total_duration:.1f}s")
 
     # Get scenes
-    scenes = script_data.get("scenes", [])
+    scenes = script_data.get("scenes", []) if isinstance(script_data, dict) else script_data.scenes
     if not scenes:
         raise ValueError("No scenes found in script data")
 
@@ -205,6 +222,10 @@ def generate_photo_video(
     # Create clips for each scene
     video_clips = []
 
+    # Photos repeat when there are more scenes than photos; decode each one
+    # once and let every scene that uses it share the same frame buffer
+    decoded = {}
+
     for i, scene in enumerate(scenes):
         # Cycle through photos if we have more scenes than photos
         photo_idx = i % len(photos)
@@ -217,7 +238,9 @@ def generate_photo_video(
 
         try:
             # Create image clip
-            clip = ImageClip(str(photo_path))
+            if photo_path not in decoded:
+                decoded[photo_path] = load_photo(photo_path)
+            clip = ImageClip(decoded[photo_path])
             clip = clip.with_duration(scene_duration)
 
             # Apply Ken Burns effect
@@ -228,11 +251,7 @@ def generate_photo_video(
         except Exception as e:
             print(f"    Error: {e}")
             # Create black clip as fallback
-            fallback = ColorClip(
-                size=RESOLUTION,
-                color=(0, 0, 0),
-                duration=scene_duration,
-            )
+            fallback = black_clip(scene_duration)
             video_clips.append(fallback)
 
     # Concatenate all clips
@@ -244,11 +263,7 @@ def generate_photo_video(
     for i, clip in enumerate(video_clips):
         if clip.size != RESOLUTION:
             # Create a black background canvas
-            background = ColorClip(
-                size=RESOLUTION,
-                color=(0, 0, 0),
-                duration=clip.duration,
-            )
+            background = black_clip(clip.duration)
             # Composite the positioned clip onto the background
             composited = CompositeVideoClip([background, clip], size=RESOLUTION)
             composited = composited.with_fps(30)
@@ -257,7 +272,15 @@ def generate_photo_video(
             composited_clips.append(clip.with_fps(30))
     video_clips = composited_clips
 
-    final_video = concatenate_videoclips(video_clips, method="compose")
+    # Every clip is exactly RESOLUTION now, so the clips can simply be
+    # played back to back instead of blended onto a shared canvas per frame
+    final_video = concatenate_videoclips(video_clips, method="chain")
+
+    # The clips now hold the only references to the frame buffers; release
+    # the lookup table and intermediate objects before the long render
+    decoded.clear()
+    composited_clips = None
+    gc.collect()
 
     # Add fade in/out
     final_video = final_video.with_effects([
@@ -3,22 +3,27 @@
 import os
 from pathlib import Path
 
-from moviepy import (
-    VideoFileClip,
-    AudioFileClip,
-    concatenate_videoclips,
-)
-from moviepy.video.fx import FadeIn, FadeOut
-
-from .config import DEFAULT_CONFIG, ensure_directories
+from moviepy import AudioFileClip
+
+from .config import DEFAULT_CONFIG, ensure_directories, pick_video_encoder
+from .ffmpeg_utils import run_ffmpeg
 from .asset_manager import AssetManager
 
+# Every cut is an open decoder in the render; longer videos are rendered in
+# batches of this many cuts and joined with a stream copy
+MAX_CUTS_PER_RENDER = 24
+
+# Sources shorter than this are never cut from
+MIN_CUT_DURATION = 0.5
+
 
 class VideoAssembler:
     """
     Simple video assembler that combines video clips with voiceover.
 
     No captions, no motion graphics - just plain video with audio.
+    Cuts are planned in Python and rendered by a single ffmpeg call
+    (in bounded batches joined by stream copy for long voiceovers).
     """
 
     def __init__(self, config: dict = None):
@@ -59,6 +64,7 @@ class VideoAssembler:
         print(f"Loading voiceover: {voiceover_path}")
         voiceover = AudioFileClip(voiceover_path)
         total_duration = voiceover.duration
+        voiceover.close()
         print(f"Duration: {total_duration:.1f}s")
 
         # Get scenes
@@ -75,92 +81,143 @@ class VideoAssembler:
         if not available_videos:
             raise FileNotFoundError("No videos found in assets folder")
 
-        # Load all video clips and get their durations
-        source_clips = {}
+        # Durations come from the asset index; only new or changed files are probed
+        metadata = self.asset_manager.get_video_metadata(available_videos)
+        durations = {}
         for video_path in available_videos:
-            clip = VideoFileClip(str(video_path))
-            source_clips[str(video_path)] = clip
-            print(f"  Loaded: {video_path.name} ({clip.duration:.1f}s)")
+            durations[str(video_path)] = metadata[str(video_path)][0]
+            print(f"  Loaded: {video_path.name} ({durations[str(video_path)]:.1f}s)")
 
         # Fast cuts: 4-5 second clips instead of scene-based duration
         import random
-        clip_duration = random.uniform(4, 5)  # Random between 4-5 seconds
-        num_clips = int(total_duration / clip_duration) + 1
-
-        print(f"\nCreating {num_clips} fast cuts ({clip_duration:.1f}s each)...")
-        video_clips = []
-        video_paths = list(source_clips.keys())
-
-        for i in range(num_clips):
-            # Randomly select which video to use
+        video_paths = [path for path, duration in durations.items() if duration > MIN_CUT_DURATION]
+        if not video_paths:
+            raise ValueError("All source videos are too short to cut from")
+
+        # Each cut is clamped to its source; footage a short source couldn't
+        # supply is carried into the next cut, so the cuts always add up to
+        # the voiceover and the fade-out is never cut off
+        cuts = []
+        covered = 0.0
+        shortfall = 0.0
+        frame = 1 / self.config["fps"]
+        while total_duration - covered > frame:
             selected_video_path = random.choice(video_paths)
-            selected_clip = source_clips[selected_video_path]
-
-            # Random clip duration between 4-5 seconds for variety
-            this_clip_duration = random.uniform(4, 5)
+            remaining = total_duration - covered
+            wanted = random.uniform(4, 5) + shortfall
+            if remaining - wanted < MIN_CUT_DURATION:
+                wanted = remaining  # Don't leave a sliver for the last cut
+            this_clip_duration = min(wanted, durations[selected_video_path])
+            shortfall = wanted - this_clip_duration
 
-            # Get random segment from this video
             start, end = self.asset_manager.get_random_clip_from_video(
                 selected_video_path,
-                selected_clip.duration,
+                durations[selected_video_path],
                 this_clip_duration
             )
-
-            print(f"  Clip {i + 1}/{num_clips}: {Path(selected_video_path).name} [{start:.1f}s - {end:.1f}s]")
-
+            cuts.append((selected_video_path, start, end - start))
+            covered += end - start
+
+        print(f"\nCreating {len(cuts)} fast cuts...")
+        for i, (selected_video_path, start, length) in enumerate(cuts):
+            print(f"  Clip {i + 1}/{len(cuts)}: {Path(selected_video_path).name} [{start:.1f}s - {start + length:.1f}s]")
+
+        codec, codec_params = pick_video_encoder()
+        encode_args = [
+            "-r", str(self.config["fps"]),
+            "-c:v", codec,
+            *codec_params,
+            "-b:v", self.config["video_bitrate"],
+            "-pix_fmt", "yuv420p",
+        ]
+        audio_args = [
+            "-c:a", self.config["audio_codec"],
+            "-b:a", self.config["audio_bitrate"],
+            "-movflags", "+faststart",
+        ]
+
+        if len(cuts) <= MAX_CUTS_PER_RENDER:
+            # Render: decode, filter, encode and mux in a single ffmpeg process
+            print(f"Rendering to {output_path} ({codec})...")
+            run_ffmpeg(
+                ["-i", voiceover_path]
+                + self._cut_render_args(cuts, 1, fade_in=True, fade_out=True)
+                + ["-map", "0:a", "-t", f"{total_duration:.3f}", *encode_args, *audio_args, output_path]
+            )
+        else:
+            # Long voiceovers: every cut is a decoder, so render bounded
+            # batches of cuts to identical segments and join them without
+            # re-encoding
+            batches = [cuts[i:i + MAX_CUTS_PER_RENDER] for i in range(0, len(cuts), MAX_CUTS_PER_RENDER)]
+            part_prefix = f"{output_path}.{os.getpid()}"
+            parts = [f"{part_prefix}.part{n:03d}.mp4" for n in range(len(batches))]
+            list_path = f"{part_prefix}.parts.txt"
             try:
-                clip = selected_clip.subclipped(start, end)
-                clip = clip.resized(self.resolution)
-                video_clips.append(clip)
-
-            except Exception as e:
-                print(f"    Error: {e}")
-                # Create black clip as fallback
-                from moviepy import ColorClip
-                fallback = ColorClip(
-                    size=self.resolution,
-                    color=(0, 0, 0),
-                    duration=this_clip_duration,
-                )
-                video_clips.append(fallback)
-
-        # Concatenate all clips
-        print("\nConcatenating clips...")
-        final_video = concatenate_videoclips(video_clips, method="compose")
-
-        # Add fade in/out
-        final_video = final_video.with_effects([
-            FadeIn(0.5),
-            FadeOut(0.5),
-        ])
-
-        # Attach voiceover
-        print("Attaching audio...")
-        final_video = final_video.with_audio(voiceover)
-
-        # Render
-        print(f"Rendering to {output_path}...")
-        final_video.write_videofile(
-            output_path,
-            fps=self.config["fps"],
-            codec=self.config["video_codec"],
-            audio_codec=self.config["audio_codec"],
-            bitrate=self.config["video_bitrate"],
-            audio_bitrate=self.config["audio_bitrate"],
-            threads=self.config["threads"],
-        )
-
-        # Cleanup
-        final_video.close()
-        voiceover.close()
-        for source_clip in source_clips.values():
-            source_clip.close()
-        for clip in video_clips:
-            clip.close()
+                for n, (batch, part) in enumerate(zip(batches, parts)):
+                    print(f"Rendering part {n + 1}/{len(batches)} ({codec})...")
+                    run_ffmpeg(
+                        self._cut_render_args(batch, 0, fade_in=(n == 0), fade_out=(n == len(batches) - 1))
+                        + ["-an", *encode_args, part]
+                    )
+
+                # concat demuxer list; quotes in paths are escaped as '\''
+                with open(list_path, "w", encoding="utf-8") as f:
+                    for part in parts:
+                        quoted = Path(part).resolve().as_posix().replace("'", "'\\''")
+                        f.write(f"file '{quoted}'\n")
+
+                print(f"Joining {len(parts)} parts into {output_path}...")
+                run_ffmpeg([
+                    "-f", "concat", "-safe", "0", "-i", list_path,
+                    "-i", voiceover_path,
+                    "-map", "0:v",
+                    "-map", "1:a",
+                    "-t", f"{total_duration:.3f}",
+                    "-c:v", "copy",
+                    *audio_args,
+                    output_path,
+                ])
+            finally:
+                for path in parts + [list_path]:
+                    Path(path).unlink(missing_ok=True)
 
         print(f"\nDone! Video saved to: {output_path}")
         return output_path
 
+    def _cut_render_args(self, cuts: list, first_input: int, fade_in: bool, fade_out: bool) -> list:
+        """
+        ffmpeg inputs and filter graph that concatenate cuts into [outv].
+
+        Each cut is its own input, seeked on the demuxer side so only the
+        needed span is decoded. first_input is the index of the first cut's
+        input (after any inputs the caller adds in front).
+        """
+        width, height = self.resolution
+        fps = self.config["fps"]
+        inputs = []
+        chains = []
+        for i, (video_path, start, length) in enumerate(cuts):
+            inputs += ["-ss", f"{start:.3f}", "-t", f"{length:.3f}", "-i", video_path]
+            # Cover-fit: scale until both sides fill the frame, then center-crop
+            # the overflow instead of stretching other aspect ratios
+            chains.append(
+                f"[{first_input + i}:v]scale={width}:{height}:force_original_aspect_ratio=increase"
+                f":flags=lanczos,crop={width}:{height},setsar=1,fps={fps},"
+                f"setpts=PTS-STARTPTS[v{i}]"
+            )
+
+        # Concatenate the cuts, with fade in/out at the ends of the video
+        labels = "".join(f"[v{i}]" for i in range(len(cuts)))
+        tail = f"{labels}concat=n={len(cuts)}:v=1:a=0"
+        if fade_in:
+            tail += ",fade=t=in:st=0:d=0.5"
+        if fade_out:
+            fade_out_start = max(0.0, sum(length for _, _, length in cuts) - 0.5)
+            tail += f",fade=t=out:st={fade_out_start:.3f}:d=0.5"
+        graph = ";".join(chains + [tail + "[outv]"])
+
+        return inputs + ["-filter_complex", graph, "-map", "[outv]"]
+
 
 def generate_video(
     script_data: dict,
@@ -1,13 +1,40 @@
+import os
+import time
+from pathlib import Path
+
 from youtube_transcript_api import YouTubeTranscriptApi
 
 ytt_api = YouTubeTranscriptApi()
 
+# Transcripts of published videos rarely change; keep them for 30 days
+CACHE_DIR = Path(".cache/youtube")
+TRANSCRIPT_CACHE_TTL = 30 * 24 * 3600
+
 def get_transcript(video_id):
     """Fetch transcript and return as a single string for LLM processing."""
     fetched_transcript = ytt_api.fetch(video_id)
     full_text = " ".join(snippet.text for snippet in fetched_transcript)
     return full_text
 
+
+def cached_transcript(video_id, max_age=TRANSCRIPT_CACHE_TTL):
+    """get_transcript(video_id), reusing a copy saved within the last max_age seconds."""
+    cache_path = CACHE_DIR / f"transcript_{video_id}.txt"
+    try:
+        if time.time() - cache_path.stat().st_mtime < max_age:
+            return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    # Failures (disabled/missing transcripts) raise and are never cached
+    full_text = get_transcript(video_id)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(full_text, encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+    return full_text
+
 if __name__ == "__main__":
     video_id = "FJ6uvFNc7gI"
     transcript = get_transcript(video_id)
@@ -1,9 +1,13 @@
 from elevenlabs.client import ElevenLabs
 from elevenlabs import play, save, VoiceSettings
 import os
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 from dotenv import load_dotenv
 
-load_dotenv()
+# .env is loaded by the entry point; running this file directly makes it one
+if __name__ == "__main__":
+    load_dotenv()
 
 api_key = os.environ.get("ELEVEN_LABS_API")
 client = ElevenLabs(api_key=api_key)
@@ -13,36 +17,81 @@ DEFAULT_VOICE_ID = "V6zMK42bu1TVQBA7MwcF"
 DEFAULT_MODEL = "eleven_multilingual_v2"
 DEFAULT_VOICE_SPEED = 1.15  # 15% faster
 
+# Scenes are synthesized in parallel, at most this many at once
+# (ElevenLabs limits concurrent requests per plan)
+MAX_TTS_WORKERS = 4
 
-def generate_voiceover(text: str, output_path: str = None, voice_id: str = DEFAULT_VOICE_ID) -> bytes:
-    """
-    Generate voiceover audio from text.
 
-    Args:
-        text: The script text to convert to speech
-        output_path: Optional file path to save the audio (e.g., "output.mp3")
-        voice_id: ElevenLabs voice ID to use
+def _stream(
+    text: str,
+    voice_id: str = DEFAULT_VOICE_ID,
+    previous_text: str = None,
+    next_text: str = None,
+):
+    """Convert one piece of text to speech, yielding MP3 chunks as they arrive.
 
-    Returns:
-        Audio bytes
+    previous_text/next_text give the model the neighbouring narration so
+    intonation stays continuous across separately generated scenes.
     """
-    audio = client.text_to_speech.convert(
+    return client.text_to_speech.convert(
         text=text,
         voice_id=voice_id,
         model_id=DEFAULT_MODEL,
         output_format="mp3_44100_128",
+        previous_text=previous_text,
+        next_text=next_text,
         voice_settings=VoiceSettings(speed=DEFAULT_VOICE_SPEED),
     )
 
-    # Convert generator to bytes
-    audio_bytes = b"".join(audio)
 
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(audio_bytes)
-        print(f"Audio saved to {output_path}")
+def _synthesize(
+    text: str,
+    voice_id: str = DEFAULT_VOICE_ID,
+    previous_text: str = None,
+    next_text: str = None,
+) -> bytes:
+    """Convert one piece of text to MP3 bytes."""
+    return b"".join(_stream(text, voice_id, previous_text, next_text))
+
+
+def generate_voiceover(text: str, output_path: str = None, voice_id: str = DEFAULT_VOICE_ID) -> bytes:
+    """
+    Generate voiceover audio from text.
+
+    Args:
+        text: The script text to convert to speech
+        output_path: Optional file path to save the audio (e.g., "output.mp3")
+        voice_id: ElevenLabs voice ID to use
 
-    return audio_bytes
+    Returns:
+        Audio bytes
+    """
+    if not output_path:
+        return _synthesize(text, voice_id)
+
+    # Write each chunk as it arrives instead of after the whole response,
+    # into a temp file so a failed stream never leaves a truncated MP3
+    chunks = []
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in _stream(text, voice_id):
+                f.write(chunk)
+                chunks.append(chunk)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, output_path)
+    print(f"Audio saved to {output_path}")
+
+    return b"".join(chunks)
+
+
+def _scene_narrations(script_output) -> list[str]:
+    """Narration of every scene (blank if missing) from a script dict or ScriptOutput."""
+    if isinstance(script_output, dict):
+        return [scene.get("narration", "") for scene in script_output.get("scenes", [])]
+    return [scene.narration for scene in script_output.scenes]
 
 
 def generate_voiceover_from_script(script_output: dict, output_dir: str = "output") -> list[str]:
@@ -50,32 +99,42 @@ def generate_voiceover_from_script(script_output: dict, output_dir: str = "outpu
     Generate voiceovers for each scene in a script.
 
     Args:
-        script_output: The script dict with 'scenes' containing 'narration' for each scene
+        script_output: The script dict (or ScriptOutput) with 'scenes' containing 'narration' for each scene
         output_dir: Directory to save audio files
 
     Returns:
         List of generated audio file paths
     """
     os.makedirs(output_dir, exist_ok=True)
-    audio_files = []
 
-    for i, scene in enumerate(script_output.get("scenes", [])):
-        narration = scene.get("narration", "")
-        if narration:
-            output_path = os.path.join(output_dir, f"scene_{i+1}.mp3")
-            generate_voiceover(narration, output_path)
-            audio_files.append(output_path)
+    jobs = [
+        (narration, os.path.join(output_dir, f"scene_{i+1}.mp3"))
+        for i, narration in enumerate(_scene_narrations(script_output))
+        if narration
+    ]
+    if not jobs:
+        return []
+
+    # Scenes are independent requests, so run them concurrently
+    with ThreadPoolExecutor(max_workers=min(MAX_TTS_WORKERS, len(jobs))) as pool:
+        list(pool.map(lambda job: generate_voiceover(*job), jobs))
 
-    return audio_files
+    return [output_path for _, output_path in jobs]
 
 
-def generate_full_voiceover(script_output: dict, output_path: str = "output/full_voiceover.mp3") -> str:
+def generate_full_voiceover(
+    script_output: dict,
+    output_path: str = "output/full_voiceover.mp3",
+    cancel: threading.Event = None,
+) -> str:
     """
     Generate a single voiceover from all scene narrations combined.
 
     Args:
-        script_output: The script dict with 'scenes' containing 'narration' for each scene
+        script_output: The script dict (or ScriptOutput) with 'scenes' containing 'narration' for each scene
         output_path: File path to save the audio
+        cancel: When set, scenes that haven't been requested yet are skipped
+            and CancelledError is raised, so no further TTS credits are spent
 
     Returns:
         Path to the generated audio file, or None if no narration found
@@ -83,14 +142,40 @@ def generate_full_voiceover(script_output: dict, output_path: str = "output/full
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
     # Combine all scene narrations (not just script summary)
-    scenes = script_output.get("scenes", [])
-    narrations = [scene.get("narration", "") for scene in scenes if scene.get("narration")]
-    full_text = " ".join(narrations).strip()
+    narrations = [text.strip() for text in _scene_narrations(script_output) if text.strip()]
 
-    if not full_text:
+    if not narrations:
         return None
 
-    generate_voiceover(full_text, output_path)
+    def synthesize(*args) -> bytes:
+        if cancel is not None and cancel.is_set():
+            raise CancelledError("Voiceover cancelled")
+        return _synthesize(*args)
+
+    # One request per scene, run concurrently; map() keeps narration order
+    with ThreadPoolExecutor(max_workers=min(MAX_TTS_WORKERS, len(narrations))) as pool:
+        segments = pool.map(
+            synthesize,
+            narrations,
+            [DEFAULT_VOICE_ID] * len(narrations),
+            [None] + narrations[:-1],
+            narrations[1:] + [None],
+        )
+
+        # Segments share one MP3 format, so their frames concatenate directly.
+        # Written to a temp file so a failed scene never leaves a truncated
+        # MP3 at output_path
+        tmp_path = f"{output_path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                for segment in segments:
+                    f.write(segment)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, output_path)
+
+    print(f"Audio saved to {output_path}")
     return output_path
 
 
@@ -2,6 +2,10 @@
 # Sample Python code for youtube.channels.list using API key
 
 import os
+import pickle
+import hashlib
+import time
+from pathlib import Path
 from datetime import datetime, timezone
 import googleapiclient.discovery
 import pandas as pd
@@ -10,15 +14,20 @@ import re
 
 from dotenv import load_dotenv
 
-load_dotenv()
+# .env is loaded by the entry point; running this file directly makes it one
+if __name__ == "__main__":
+    load_dotenv()
 # Create an API client
 
 api_service_name = "youtube"
 api_version = "v3"
 api_key = os.environ.get("YOUTUBE_API_KEY")
 
+# Use the discovery document bundled with the client library instead of
+# fetching it from Google on every start
 youtube = googleapiclient.discovery.build(
-        api_service_name, api_version, developerKey=api_key)
+        api_service_name, api_version, developerKey=api_key,
+        cache_discovery=False, static_discovery=True)
 
 
 
@@ -35,7 +44,7 @@ def convert_to_seconds(time_str):
         raise ValueError("Invalid time format")
 
 
-def getVideoViewCount(video_id, df):
+def getVideoViewCount(video_id, rows):
 
     request = youtube.videos().list(
         part="snippet,contentDetails,statistics",
@@ -65,14 +74,8 @@ def getVideoViewCount(video_id, df):
         # Construct video link
         video_link = f"https://youtube.com/watch?v={video_id}"
 
-        df = pd.concat([df, pd.DataFrame({
-            "Title": [title],
-            "View Count": [views],
-            "Days Old": [days_old],
-            "Virality Score": [virality_score],
-            "Video Link": [video_link]
-        })], ignore_index=True)
-    return df
+        rows.append((title, views, days_old, virality_score, video_link))
+    return rows
     
 
 
@@ -99,7 +102,7 @@ def getPlaylistId(channel_id):
 
     return playlist_id
 
-def getVideoId(playlist_id,df):
+def getVideoId(playlist_id,rows):
     request_vidid = youtube.playlistItems().list(
         part="contentDetails",
         maxResults=15,
@@ -115,8 +118,8 @@ def getVideoId(playlist_id,df):
     
     
     for v in videos_list:
-        df = getVideoViewCount(v["contentDetails"]["videoId"],df)
-    return df
+        rows = getVideoViewCount(v["contentDetails"]["videoId"],rows)
+    return rows
 
 def main():
     return 0
@@ -125,19 +128,46 @@ if __name__ == "__main__":
     main()
 def start(name):
 
-    df = pd.DataFrame(columns=["Title", "View Count", "Days Old", "Virality Score", "Video Link"])
-
     channelid = getChannelId(name)
     playlistid = getPlaylistId(channelid)
-    df = getVideoId(playlistid, df)
+    rows = getVideoId(playlistid, [])
+
+    # Build the frame once from the collected rows; a float score column
+    # keeps the sort in NumPy instead of comparing Python objects
+    df = pd.DataFrame(rows, columns=["Title", "View Count", "Days Old", "Virality Score", "Video Link"])
+    df["Virality Score"] = df["Virality Score"].astype("float64")
 
     # Normalize virality score to 0-100 scale
     max_score = df["Virality Score"].max()
     if max_score > 0:
         df["Virality Score"] = round((df["Virality Score"] / max_score) * 100, 2)
 
-    df = df.sort_values(by='Virality Score', ascending=False, inplace=False)
+    df.sort_values(by='Virality Score', ascending=False, inplace=True, kind="stable", ignore_index=True)
     return df
 
 
+# Channel listings are kept on disk for a day so re-runs skip the API quota
+CACHE_DIR = Path(".cache/youtube")
+CHANNEL_CACHE_TTL = 24 * 3600
 
+
+def cached_start(name, max_age=CHANNEL_CACHE_TTL):
+    """start(name), reusing a result saved within the last max_age seconds."""
+    key = hashlib.sha256(name.encode()).hexdigest()
+    cache_path = CACHE_DIR / f"channel_{key}.pkl"
+    try:
+        if time.time() - cache_path.stat().st_mtime < max_age:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+    except Exception:
+        # Missing, truncated, or pickled by another pandas version: refetch
+        pass
+
+    df = start(name)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return df